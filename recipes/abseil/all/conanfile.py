@@ -1,5 +1,5 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
@@ -25,10 +25,27 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "use_std_optional": ["auto", True, False],
+        "use_std_string_view": ["auto", True, False],
+        "use_std_variant": ["auto", True, False],
+        "use_std_any": ["auto", True, False],
+        "hardened": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "use_std_optional": "auto",
+        "use_std_string_view": "auto",
+        "use_std_variant": "auto",
+        "use_std_any": "auto",
+        "hardened": False,
+    }
+    options_description = {
+        "use_std_optional": "absl::optional is an alias of std::optional (True), its own type (False) or detected from the C++ standard (auto)",
+        "use_std_string_view": "absl::string_view is an alias of std::string_view (True), its own type (False) or detected from the C++ standard (auto)",
+        "use_std_variant": "absl::variant is an alias of std::variant (True), its own type (False) or detected from the C++ standard (auto)",
+        "use_std_any": "absl::any is an alias of std::any (True), its own type (False) or detected from the C++ standard (auto)",
+        "hardened": "Enable bounds checks in Abseil types (ABSL_OPTION_HARDENED)",
     }
     short_paths = True
     extension_properties = {"compatibility_cppstd": False}
@@ -44,9 +61,26 @@ class AbseilConan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+    @property
+    def _options_h_values(self):
+        # Values of absl/base/options.h macros: 0 = Abseil type, 1 = std alias, 2 = detected
+        values = {}
+        for option in ["use_std_optional", "use_std_string_view", "use_std_variant", "use_std_any"]:
+            value = self.options.get_safe(option)
+            if value == "auto":
+                values[option.upper()] = 2
+            else:
+                values[option.upper()] = 1 if value else 0
+        values["HARDENED"] = 1 if self.options.hardened else 0
+        return values
+
     def validate(self):
         check_min_cppstd(self, 14)
 
+        for option in ["use_std_optional", "use_std_string_view", "use_std_variant", "use_std_any"]:
+            if self.options.get_safe(option) == True:
+                check_min_cppstd(self, 17)
+
         if self.options.shared and is_msvc(self) and Version(self.version) < "20230802.1":
             # upstream tries its best to export symbols, but it's broken for the moment
             raise ConanInvalidConfiguration(f"{self.ref} shared not availabe for Visual Studio, please use version 20230802.1 or newer")
@@ -72,7 +106,17 @@ class AbseilConan(ConanFile):
             tc.cache_variables["ABSL_MSVC_STATIC_RUNTIME"] = is_msvc_static_runtime(self)
         tc.generate()
 
+    def _patch_sources(self):
+        options_h = os.path.join(self.source_folder, "absl", "base", "options.h")
+        content = load(self, options_h)
+        for name, value in self._options_h_values.items():
+            content, count = re.subn(rf"#define ABSL_OPTION_{name} \d", f"#define ABSL_OPTION_{name} {value}", content)
+            if count != 1:
+                raise ConanException(f"ABSL_OPTION_{name} not found in absl/base/options.h")
+        save(self, options_h, content)
+
     def build(self):
+        self._patch_sources()
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
@@ -97,8 +97,10 @@ class BoostConan(ConanFile):
         "lzma": [True, False],
         "zstd": [True, False],
         "segmented_stacks": [True, False],
+        "context_impl": [None, "fcontext", "ucontext", "winfib"],  # None uses the b2 default (fcontext)
         "debug_level": list(range(0, 14)),
         "pch": [True, False],
+        "lto": [None, "full", "thin"],  # link-time optimization of the compiled libraries
         "extra_b2_flags": [None, "ANY"],  # custom b2 flags
         "i18n_backend": ["iconv", "icu", None, "deprecated"],
         "i18n_backend_iconv": ["libc", "libiconv", "off"],
@@ -136,8 +138,10 @@ class BoostConan(ConanFile):
         "lzma": False,
         "zstd": False,
         "segmented_stacks": False,
+        "context_impl": None,
         "debug_level": 0,
         "pch": True,
+        "lto": None,
         "extra_b2_flags": None,
         "i18n_backend": "deprecated",
         "i18n_backend_iconv": "libc",
@@ -343,30 +347,11 @@ class BoostConan(ConanFile):
         return self._cached_dependencies
 
     def _all_dependent_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set()
-            for dependency in dependencies:
-                new_dependencies.update(set(self._dependencies["dependencies"][dependency]))
-                new_dependencies.update(dependencies)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        # Transitive closures are precomputed by rebuild-dependencies.py
+        return {name}.union(self._dependencies["all_dependencies"][name])
 
     def _all_super_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set(dependencies)
-            for module in self._dependencies["dependencies"]:
-                if dependencies.intersection(set(self._dependencies["dependencies"][module])):
-                    new_dependencies.add(module)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return {name}.union(self._dependencies["all_dependents"][name])
 
     @property
     def _bcp_dir(self):
@@ -631,6 +616,8 @@ class BoostConan(ConanFile):
         if self.options.header_only:
             self.options.rm_safe("shared")
             self.options.rm_safe("fPIC")
+            self.options.rm_safe("lto")
+            self.options.rm_safe("context_impl")
         elif self.options.shared:
             self.options.rm_safe("fPIC")
 
@@ -665,6 +652,9 @@ class BoostConan(ConanFile):
         if self.options.without_fiber:
             self.options.rm_safe("numa")
 
+        if self.options.get_safe("without_context", True):
+            self.options.rm_safe("context_impl")
+
         # Use verbosity from [conf] if specified
         verbosity = self.conf.get("tools.build:verbosity", default="quiet")
         if verbosity == "verbose" and int(self.options.debug_level) < 2:
@@ -735,6 +725,21 @@ class BoostConan(ConanFile):
                 "Boost.Locale library needs either iconv or ICU library to be built on non windows platforms"
             )
 
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl == "winfib" and not self._is_windows_platform:
+            raise ConanInvalidConfiguration(f"{self.ref}:context_impl=winfib is only available on Windows")
+        if context_impl == "ucontext" and self._is_windows_platform:
+            raise ConanInvalidConfiguration(f"{self.ref}:context_impl=ucontext is not available on Windows")
+        if self.options.segmented_stacks and context_impl in ("fcontext", "winfib"):
+            raise ConanInvalidConfiguration(f"{self.ref}:segmented_stacks requires context_impl=ucontext")
+
+        if self.options.get_safe("lto"):
+            # b2 only implements the lto feature for these toolsets
+            if self._toolset not in ("gcc", "clang", "clang-linux", "clang-darwin", "msvc"):
+                raise ConanInvalidConfiguration(f"{self.ref}:lto is not supported by the b2 toolset {self._toolset}")
+            if self.options.lto == "thin" and self.settings.compiler not in ("clang", "apple-clang"):
+                raise ConanInvalidConfiguration(f"{self.ref}:lto=thin requires clang")
+
         if self._stacktrace_addr2line_available:
             if not os.path.isabs(str(self.options.addr2line_location)):
                 raise ConanInvalidConfiguration("addr2line_location must be an absolute path to addr2line")
@@ -1388,7 +1393,19 @@ class BoostConan(ConanFile):
             flags.extend(["segmented-stacks=on",
                           "define=BOOST_USE_SEGMENTED_STACKS=1",
                           "define=BOOST_USE_UCONTEXT=1"])
+        context_impl = self.options.get_safe("context_impl")
+        if context_impl:
+            flags.append(f"context-impl={context_impl}")
+            # Also build the libraries using Boost.Context (coroutine, fiber, ...) with the same implementation
+            if context_impl == "ucontext" and not self.options.segmented_stacks:
+                flags.append("define=BOOST_USE_UCONTEXT=1")
+            elif context_impl == "winfib":
+                flags.append("define=BOOST_USE_WINFIB=1")
         flags.append("pch=on" if self.options.pch else "pch=off")
+        if self.options.get_safe("lto"):
+            flags.append("lto=on")
+            if not is_msvc(self):
+                flags.append(f"lto-mode={self.options.lto}")
 
         if is_apple_os(self):
             apple_min_version_flag = AutotoolsToolchain(self).apple_min_version_flag
@@ -1771,6 +1788,12 @@ class BoostConan(ConanFile):
         if self.options.segmented_stacks:
             self.cpp_info.components["headers"].defines.extend(["BOOST_USE_SEGMENTED_STACKS", "BOOST_USE_UCONTEXT"])
 
+        # Consumers must see the same context implementation as the compiled libraries
+        if self.options.get_safe("context_impl") == "ucontext" and not self.options.segmented_stacks:
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_UCONTEXT")
+        elif self.options.get_safe("context_impl") == "winfib":
+            self.cpp_info.components["headers"].defines.append("BOOST_USE_WINFIB")
+
         if self.options.system_use_utf8:
             self.cpp_info.components["headers"].defines.append("BOOST_SYSTEM_USE_UTF8")
 
@@ -2089,6 +2112,16 @@ class BoostConan(ConanFile):
                 (self.settings.compiler == "gcc" and Version(self.settings.compiler.version) == "10"):
                 self.cpp_info.components["cobalt"].cxxflags.append("-fcoroutines")
 
+            if self.options.get_safe("lto"):
+                # Static libraries (including the static only ones of a shared build) contain
+                # LTO objects, which can only be linked with link-time optimization enabled
+                if is_msvc(self):
+                    lto_flags = ["/LTCG"]
+                else:
+                    lto_flags = ["-flto=thin" if self.options.lto == "thin" else "-flto"]
+                self.cpp_info.components["_libboost"].sharedlinkflags.extend(lto_flags)
+                self.cpp_info.components["_libboost"].exelinkflags.extend(lto_flags)
+
         #TODO: remove in the future, user_info deprecated in conan2, but kept for compatibility while recipe is cross-compatible.
         self.user_info.stacktrace_addr2line_available = self._stacktrace_addr2line_available
         self.conf_info.define("user.boost:stacktrace_addr2line_available", self._stacktrace_addr2line_available)
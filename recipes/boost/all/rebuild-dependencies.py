@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
 import dataclasses
 import json
 import logging
+import os
 import pprint
 import re
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import yaml
 from conan.tools.files import chdir
@@ -21,6 +23,10 @@ log.setLevel(logging.WARNING)
 
 BOOST_GIT_URL = "https://github.com/boostorg/boost.git"
 
+# Part of every cache key: bump it whenever this script changes how it parses boostdep output
+# and Jamfiles, or how it builds the dependency files (e.g. CONFIGURE_OPTIONS, _fix_dependencies)
+CACHE_FORMAT_VERSION = 1
+
 # When adding (or removing) an option, also add this option to the list in
 # `conanfile.py` and re-run this script.
 CONFIGURE_OPTIONS = (
@@ -94,6 +100,9 @@ class BoostDependenciesExport(object):
     version: str
     configure_options: List[str]
     dependencies: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
+    # Transitive closures of `dependencies`, so the recipe does not need to compute them
+    all_dependencies: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
+    all_dependents: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
     libs: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
     requirements: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
     static_only: List[str] = dataclasses.field(default_factory=list)
@@ -106,17 +115,28 @@ class BoostDependencies(object):
 
 
 class BoostDependencyBuilder(object):
-    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool):
+    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool,
+                 cachedir: Optional[Path] = None, worktree: bool = False, boostdep: Optional[Path] = None):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
         self.git_url = git_url
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
-        self._boostdep = None
+        self.cachedir = cachedir
+        self.worktree = worktree
+        self._boostdep = boostdep
+        self._submodule_commits = None
 
     @property
     def boost_path(self) -> Path:
+        if self.worktree:
+            # Private clone, so several versions can be processed at the same time
+            return self.tmppath / f"boost-{self.boost_version}"
+        return self.tmppath / "boost"
+
+    @property
+    def reference_path(self) -> Path:
         return self.tmppath / "boost"
 
     def do_git_update(self) -> None:
@@ -138,6 +158,18 @@ class BoostDependencyBuilder(object):
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
 
+    def do_git_clone_worktree(self) -> None:
+        if self.boost_path.exists():
+            return
+        with chdir(self, self.tmppath):
+            print(f"Cloning boost git for version {self.boost_version}")
+            # Borrow the objects of the main clone (and of its submodules) instead of downloading them again
+            subprocess.check_call(["git", "clone", "--no-checkout", "--reference", str(self.reference_path),
+                                   "--", self.git_url, self.boost_path.name])
+        with chdir(self, self.boost_path):
+            subprocess.check_call(["git", "config", "submodule.alternateLocation", "superproject"])
+            subprocess.check_call(["git", "config", "submodule.alternateErrorStrategy", "info"])
+
     def do_git_submodule_update(self):
         with chdir(self, self.boost_path):
             if not self.unsafe:
@@ -158,12 +190,72 @@ class BoostDependencyBuilder(object):
             print("Removing unknown files/directories")
             subprocess.check_call(["git", "clean", "-d", "-f"])
 
-    def do_install_boostdep(self):
+    def do_install_boostdep(self) -> Path:
         with chdir(self, self.boost_path):
             print(f"Installing boostdep/{self.boostdep_version}")
             cmd = ["conan", "install", "--tool-requires", f"boostdep/{self.boostdep_version}", "--format", "json", "-vquiet"]
             info = json.loads(subprocess.check_output(cmd))
             self._boostdep = Path(info["graph"]["nodes"]["1"]["package_folder"]) / "bin" / "boostdep"
+        return self._boostdep
+
+    def _git_head(self) -> str:
+        with chdir(self, self.boost_path):
+            return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+
+    def _submodule_commit(self, module: str) -> Optional[str]:
+        if self._submodule_commits is None:
+            self._submodule_commits = {}
+            with chdir(self, self.boost_path):
+                output = subprocess.check_output(["git", "ls-tree", "-r", "HEAD", "--", "libs"], text=True)
+            for line in output.splitlines():
+                # <mode> SP <type> SP <object> TAB <file>
+                info, path = line.split("\t", 1)
+                _, obj_type, obj = info.split()
+                if obj_type == "commit":
+                    self._submodule_commits[path[len("libs/"):]] = obj
+        return self._submodule_commits.get(module)
+
+    def _cache_path(self, kind: str, key: Optional[str]) -> Optional[Path]:
+        if self.cachedir is None or key is None:
+            return None
+        return self.cachedir / f"v{CACHE_FORMAT_VERSION}" / kind / f"{key}.json"
+
+    def _cached(self, kind: str, key: Optional[str], compute: Callable):
+        """Return the result of compute(), cached on disk as json under key.
+        The key must identify the content the result is computed from (e.g. a git commit)."""
+        path = self._cache_path(kind, key)
+        if path is None:
+            return compute()
+        if path.is_file():
+            log.debug("Using cached %s for %s", kind, key)
+            return json.loads(path.read_text())
+        result = compute()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write and rename, so concurrent processes never read a partial file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(result))
+        tmp.replace(path)
+        return result
+
+    def _version_key(self) -> Optional[str]:
+        # The superproject commit of the release tag pins all submodules, so together with
+        # the boostdep version it identifies the whole dependency file.
+        # In unsafe mode, stale submodules may still be around, so the commit does not identify the tree.
+        if self.unsafe:
+            return None
+        with chdir(self, self.boost_path):
+            try:
+                commit = subprocess.check_output(["git", "rev-parse", "--verify", "--quiet", f"boost-{self.boost_version}^{{commit}}"], text=True).strip()
+            except subprocess.CalledProcessError:
+                return None
+        return f"{self.boostdep_version}-{commit}"
+
+    def _module_key(self, module: str) -> Optional[str]:
+        # In unsafe mode, the checked out module may not match the commit recorded in the superproject
+        if self.unsafe:
+            return None
+        commit = self._submodule_commit(module)
+        return f"{module}-{commit}" if commit else None
 
     _GREP_IGNORE_PREFIX = ("#", "\"")
     _GREP_IGNORE_PARTS = ("boost", "<", ">")
@@ -190,6 +282,9 @@ class BoostDependencyBuilder(object):
         return list(res)
 
     def _grep_requirements(self, component: str) -> List[str]:
+        return self._cached("requirements", self._module_key(component), lambda: self._grep_requirements_uncached(component))
+
+    def _grep_requirements_uncached(self, component: str) -> List[str]:
         jam = self.boost_path / "libs" / component / "build" / "Jamfile.v2"
         if not jam.is_file():
             jam = self.boost_path / "libs" / component / "build" / "Jamfile"
@@ -226,30 +321,40 @@ class BoostDependencyBuilder(object):
             unknown_libs.add(req)
         return list(conan_requirements), system_libs, list(unknown_libs)
 
-    def do_boostdep_collect(self) -> BoostDependencies:
+    def _run_boostdep(self) -> Dict[str, str]:
         with chdir(self, self.boost_path):
             buildables = subprocess.check_output([self._boostdep, "--list-buildable"], text=True)
-            buildables = buildables.splitlines()
-            log.debug("`boostdep --list--buildable` returned these buildables: %s", buildables)
-
             # modules = subprocess.check_output([self._boostdep_path, "--list-modules"])
             # modules = modules.decode().splitlines()
-
-            dependency_tree = {}
             buildable_dependencies = subprocess.check_output([self._boostdep, "--list-buildable-dependencies"], text=True)
-            log.debug("boostdep --list-buildable-dependencies returns: %s", buildable_dependencies)
-            for line in buildable_dependencies.splitlines():
-                if re.match(r"^[\s]*#.*", line):
-                    continue
-                match = re.match(r"([\S]+)\s*=\s*([^;]+)\s*;\s*", line)
-                if not match:
-                    continue
-                master = match.group(1)
-                dependencies = re.split(r"\s+", match.group(2).strip())
-                dependency_tree[master] = dependencies
-
-            log.debug("Using `boostdep --track-sources`, the following dependency tree was calculated:")
-            log.debug(pprint.pformat(dependency_tree))
+        return {
+            "buildables": buildables,
+            "buildable_dependencies": buildable_dependencies,
+        }
+
+    def do_boostdep_collect(self) -> BoostDependencies:
+        # The output of boostdep only depends on the checked out boost tree (and boostdep itself).
+        # In unsafe mode, stale submodules may still be around, so the commit does not identify the tree.
+        boostdep_key = None if self.unsafe else f"{self.boostdep_version}-{self._git_head()}"
+        boostdep_output = self._cached("boostdep", boostdep_key, self._run_boostdep)
+        buildables = boostdep_output["buildables"].splitlines()
+        log.debug("`boostdep --list--buildable` returned these buildables: %s", buildables)
+
+        dependency_tree = {}
+        buildable_dependencies = boostdep_output["buildable_dependencies"]
+        log.debug("boostdep --list-buildable-dependencies returns: %s", buildable_dependencies)
+        for line in buildable_dependencies.splitlines():
+            if re.match(r"^[\s]*#.*", line):
+                continue
+            match = re.match(r"([\S]+)\s*=\s*([^;]+)\s*;\s*", line)
+            if not match:
+                continue
+            master = match.group(1)
+            dependencies = re.split(r"\s+", match.group(2).strip())
+            dependency_tree[master] = dependencies
+
+        log.debug("Using `boostdep --track-sources`, the following dependency tree was calculated:")
+        log.debug(pprint.pformat(dependency_tree))
 
         filtered_dependency_tree = {k: [d for d in v if d in buildables] for k, v in dependency_tree.items() if k in buildables}
 
@@ -329,25 +434,55 @@ class BoostDependencyBuilder(object):
             raise Exception(f"Dependency cycle detected. Remaining tree: {remaining_tree}")
         return deptree
 
+    @staticmethod
+    def transitive_closures(tree: Dict[str, List[str]]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Return, for each module, all the modules it depends on and all the modules depending on it"""
+        all_dependencies = {}
+
+        def visit(module):
+            if module not in all_dependencies:
+                result = set()
+                for dep in tree[module]:
+                    result.add(dep)
+                    result.update(visit(dep))
+                all_dependencies[module] = result
+            return all_dependencies[module]
+
+        for module in tree:
+            visit(module)
+        all_dependents = {module: set() for module in tree}
+        for module, deps in all_dependencies.items():
+            for dep in deps:
+                all_dependents[dep].add(module)
+        return ({k: sorted(v) for k, v in all_dependencies.items()},
+                {k: sorted(v) for k, v in all_dependents.items()})
+
     @staticmethod
     def _boostify_library(lib: str) -> str:
         return f"boost_{lib}"
 
+    def _grep_buildable_libs(self, buildable: str) -> List[str]:
+        return self._cached("libs", self._module_key(buildable), lambda: self._grep_buildable_libs_uncached(buildable))
+
+    def _grep_buildable_libs_uncached(self, buildable: str) -> List[str]:
+        construct_jam = lambda jam_ext : self.boost_path / "libs" / buildable / "build" / f"Jamfile{jam_ext}"
+        try:
+            buildable_jam = next(construct_jam(jam_ext) for jam_ext in ("", ".v2") if construct_jam(jam_ext).is_file())
+        except StopIteration:
+            raise Exception(f"Cannot find jam build file for {buildable}")
+        jam_text = buildable_jam.read_text()
+        buildable_libs = re.findall("[ \n](boost-)?lib ([a-zA-Z0-9_]+)[ \n]", jam_text)
+        buildable_libs = set(f"boost_{lib}" if lib_prefix else lib for lib_prefix, lib in buildable_libs)
+        buildable_libs = set(l[len("boost_"):] for l in buildable_libs if l.startswith("boost_"))  # list(filter(lambda l: l.startswith("boost"), buildable_libs))
+        return sorted(buildable_libs)
+
     def do_create_libraries(self, boost_dependencies: BoostDependencies):
         libraries = {}
         module_provides_extra = {}
 
         #  Look for the names of libraries in Jam build files
         for buildable in boost_dependencies.buildables:
-            construct_jam = lambda jam_ext : self.boost_path / "libs" / buildable / "build" / f"Jamfile{jam_ext}"
-            try:
-                buildable_jam = next(construct_jam(jam_ext) for jam_ext in ("", ".v2") if construct_jam(jam_ext).is_file())
-            except StopIteration:
-                raise Exception(f"Cannot find jam build file for {buildable}")
-            jam_text = buildable_jam.read_text()
-            buildable_libs = re.findall("[ \n](boost-)?lib ([a-zA-Z0-9_]+)[ \n]", jam_text)
-            buildable_libs = set(f"boost_{lib}" if lib_prefix else lib for lib_prefix, lib in buildable_libs)
-            buildable_libs = set(l[len("boost_"):] for l in buildable_libs if l.startswith("boost_"))  # list(filter(lambda l: l.startswith("boost"), buildable_libs))
+            buildable_libs = set(self._grep_buildable_libs(buildable))
 
             if not buildable_libs:
                 # Some boost releases support multiple python versions
@@ -407,21 +542,46 @@ class BoostDependencyBuilder(object):
         else:
             return item
 
-    def do_create_dependency_file(self) -> None:
+    def _collect_dependency_data(self) -> dict:
         tree = self.do_boostdep_collect()
         tree = self.do_create_libraries(tree)
 
         tree.export.dependencies = self._fix_dependencies(tree.export.dependencies)
+        tree.export.all_dependencies, tree.export.all_dependents = self.transitive_closures(tree.export.dependencies)
+
+        return self._sort_item(dataclasses.asdict(tree.export))
 
-        data = dataclasses.asdict(tree.export)
+    def _write_dependency_file(self, data: dict) -> None:
+        print(f"Creating {self._outputpath}")
+        with self._outputpath.open("w") as fout:
+            yaml.dump(data, fout)
+
+    def do_reuse_dependency_file(self) -> bool:
+        """Write the dependency file from the cache, if this release and boostdep version were already processed.
+        This skips the (slow) checkout of the submodules of the release."""
+        path = self._cache_path("dependencies", self._version_key())
+        if path is None or not path.is_file():
+            return False
+        print(f"Reusing cached dependencies of {self.boost_version}")
+        self._write_dependency_file(json.loads(path.read_text()))
+        return True
+
+    def do_create_dependency_file(self) -> None:
+        data = self._cached("dependencies", self._version_key(), self._collect_dependency_data)
         if self.unsafe:
             data["UNSAFE"] = "!DO NOT COMMIT! !THIS FILE IS GENERATED WITH THE UNSAFE OPTION ENABLED!"
+        self._write_dependency_file(data)
 
-        data = self._sort_item(data)
 
-        print(f"Creating {self.outputdir}")
-        with self._outputpath.open("w") as fout:
-            yaml.dump(data, fout)
+def _create_dependency_file(builder: BoostDependencyBuilder) -> str:
+    # Runs in a worker process in parallel mode
+    if builder.worktree:
+        builder.do_git_clone_worktree()
+    if builder.do_reuse_dependency_file():
+        return builder.boost_version
+    builder.do_git_submodule_update()
+    builder.do_create_dependency_file()
+    return builder.boost_version
 
 
 def main(args=None) -> int:
@@ -433,10 +593,16 @@ def main(args=None) -> int:
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
     parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-j", "--jobs", dest="jobs", default=1, type=int,
+                        help="number of boost versions processed in parallel (each one uses its own clone)")
+    parser.add_argument("-c", "--cache", dest="cachedir", default=None, type=Path,
+                        help="folder caching dependency files, boostdep and Jamfile results (default is <tmppath>/boost-dependencies-cache)")
+    parser.add_argument("--no-cache", dest="no_cache", action="store_true", help="do not use cached results")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
     version_group.add_argument("-v", dest="boost_version", help="boost version")
-    version_group.add_argument("-A", dest="boost_version", action="store_const", const=None, help="All boost versions")
+    version_group.add_argument("--versions", dest="boost_versions", nargs="+", help="boost versions")
+    version_group.add_argument("-A", dest="all_versions", action="store_true", help="All boost versions")
     ns = parser.parse_args(args)
 
     logging.basicConfig(format="[%(levelname)s] %(message)s")
@@ -445,46 +611,81 @@ def main(args=None) -> int:
 
     if not ns.tmppath:
         ns.tmppath = Path(tempfile.gettempdir())
+    ns.tmppath = Path(ns.tmppath).absolute()
     print(f"Temporary folder is {ns.tmppath}")
     if not ns.outputdir:
         ns.outputdir = Path("dependencies")
+    ns.outputdir = ns.outputdir.absolute()
     print(f"Dependencies folder is {ns.outputdir}")
+    if ns.no_cache:
+        ns.cachedir = None
+    elif not ns.cachedir:
+        ns.cachedir = ns.tmppath / "boost-dependencies-cache"
+    if ns.cachedir:
+        ns.cachedir = ns.cachedir.absolute()
+        print(f"Cache folder is {ns.cachedir}")
 
     ns.outputdir.mkdir(exist_ok=True)
 
-    git_update_done = False
-
-    if ns.boost_version is None:
+    if ns.all_versions:
         conan_data = yaml.safe_load(Path("conandata.yml").open())
         boost_versions = list(conan_data["sources"].keys())
+    elif ns.boost_versions:
+        boost_versions = ns.boost_versions
     else:
         boost_versions = [ns.boost_version]
 
-    for boost_version in boost_versions:
-        print(f"Starting {boost_version}")
-        boost_collector = BoostDependencyBuilder(
+    def create_builder(boost_version: str, worktree: bool = False, boostdep: Optional[Path] = None) -> BoostDependencyBuilder:
+        return BoostDependencyBuilder(
             boost_version=boost_version,
             boostdep_version=ns.boostdep_version,
             git_url=ns.git_url,
             outputdir=ns.outputdir,
             tmppath=ns.tmppath,
             unsafe=ns.unsafe,
+            cachedir=ns.cachedir,
+            worktree=worktree,
+            boostdep=boostdep,
         )
 
-        if not ns.git_update and not boost_collector.boost_path.exists():
-            log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
-            return 1
+    main_collector = create_builder(boost_versions[0])
+    if not ns.git_update and not main_collector.boost_path.exists():
+        log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
+        return 1
 
-        if ns.git_update and not git_update_done:
-            boost_collector.do_git_update()
-            git_update_done = True
+    if ns.git_update:
+        main_collector.do_git_update()
 
-        boost_collector.do_git_submodule_update()
+    # Install boostdep once: the conan cache must not be used concurrently
+    boostdep = main_collector.do_install_boostdep()
 
-        boost_collector.do_install_boostdep()
+    if ns.jobs <= 1 or len(boost_versions) == 1:
+        for boost_version in boost_versions:
+            print(f"Starting {boost_version}")
+            _create_dependency_file(create_builder(boost_version, boostdep=boostdep))
+        return 0
 
-        boost_collector.do_create_dependency_file()
-    return 0
+    if not (main_collector.boost_path / ".git" / "modules").is_dir():
+        # Private clones borrow the objects of the submodules of the main clone
+        with chdir(main_collector, main_collector.boost_path):
+            print("Init git submodules of the main clone")
+            subprocess.check_call(["git", "submodule", "update", "--init"])
+
+    failed = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=ns.jobs) as executor:
+        futures = {}
+        for boost_version in boost_versions:
+            print(f"Starting {boost_version}")
+            futures[executor.submit(_create_dependency_file, create_builder(boost_version, worktree=True, boostdep=boostdep))] = boost_version
+        for future in concurrent.futures.as_completed(futures):
+            boost_version = futures[future]
+            try:
+                future.result()
+                print(f"Finished {boost_version}")
+            except Exception as e:
+                log.error("Failed to create the dependencies of %s: %s", boost_version, e)
+                failed.append(boost_version)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
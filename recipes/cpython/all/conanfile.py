@@ -1,10 +1,12 @@
+import glob
 import os
 import re
 import textwrap
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os, fix_apple_shared_install_name
+from conan.tools.build import cross_building
 from conan.tools.env import VirtualRunEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, mkdir, replace_in_file, rm, rmdir, save, unzip
 from conan.tools.gnu import Autotools, AutotoolsToolchain, AutotoolsDeps, PkgConfigDeps
@@ -29,6 +31,7 @@ class CPythonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "optimizations": [True, False],
+        "pgo_task": [None, "ANY"],
         "lto": [True, False],
         "docstrings": [True, False],
         "pymalloc": [True, False],
@@ -39,6 +42,7 @@ class CPythonConan(ConanFile):
         "with_tkinter": [True, False],
         "with_curses": [True, False],
         "with_lzma": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc", "tcmalloc"],
 
         # options that don't change package id
         "env_vars": [True, False],  # set environment variables
@@ -47,6 +51,7 @@ class CPythonConan(ConanFile):
         "shared": False,
         "fPIC": True,
         "optimizations": False,
+        "pgo_task": None,
         "lto": False,
         "docstrings": True,
         "pymalloc": True,
@@ -57,12 +62,21 @@ class CPythonConan(ConanFile):
         "with_tkinter": True,
         "with_curses": True,
         "with_lzma": True,
+        "allocator": "system",
 
         # options that don't change package id
         "env_vars": True,
     }
     short_paths = True
 
+    @property
+    def _allocator_requirement(self):
+        return {
+            "jemalloc": "jemalloc::jemalloc",
+            "mimalloc": "mimalloc::mimalloc",
+            "tcmalloc": "gperftools::gperftools",
+        }.get(str(self.options.allocator))
+
     @property
     def _supports_modules(self):
         return not is_msvc(self) or self.options.shared
@@ -93,12 +107,19 @@ class CPythonConan(ConanFile):
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
+        if not self.options.optimizations:
+            self.options.rm_safe("pgo_task")
         if not self._supports_modules:
             self.options.rm_safe("with_bz2")
             self.options.rm_safe("with_sqlite3")
             self.options.rm_safe("with_tkinter")
             self.options.rm_safe("with_lzma")
 
+        if self.options.allocator == "jemalloc":
+            self.options["jemalloc"].prefix = ""
+        elif self.options.allocator == "mimalloc":
+            self.options["mimalloc"].override = True
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
@@ -143,6 +164,13 @@ class CPythonConan(ConanFile):
             self.requires("ncurses/6.4", transitive_headers=True, transitive_libs=True)
         if self.options.get_safe("with_lzma", False):
             self.requires("xz_utils/5.4.5")
+        # AutotoolsDeps puts the allocator in LIBS, so the interpreter and libpython link it ahead of libc
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.1.9")
+        elif self.options.allocator == "tcmalloc":
+            self.requires("gperftools/2.16")
 
     def package_id(self):
         del self.info.options.env_vars
@@ -153,16 +181,11 @@ class CPythonConan(ConanFile):
                 raise ConanInvalidConfiguration(
                     "cpython does not support MT(d) runtime when building a shared cpython library"
                 )
+        if self.options.optimizations and cross_building(self):
+            raise ConanInvalidConfiguration("optimizations=True requires running the instrumented interpreter, cross building is not supported")
         if is_msvc(self):
-            if self.options.optimizations:
-                raise ConanInvalidConfiguration(
-                    "This recipe does not support optimized MSVC cpython builds (yet)"
-                )
-                # FIXME: should probably throw when cross building
-                # FIXME: optimizations for Visual Studio, before building the final `build_type`:
-                # 1. build the MSVC PGInstrument build_type,
-                # 2. run the instrumented binaries, (PGInstrument should have created a `python.bat` file in the PCbuild folder)
-                # 3. build the MSVC PGUpdate build_type
+            if self.options.optimizations and self.settings.build_type == "Debug":
+                raise ConanInvalidConfiguration("optimizations=True is not supported for Debug MSVC cpython builds")
             if self.settings.build_type == "Debug" and "d" not in msvc_runtime_flag(self):
                 raise ConanInvalidConfiguration(
                     "Building debug cpython requires a debug runtime (Debug cpython requires _CrtReportMode"
@@ -186,6 +209,14 @@ class CPythonConan(ConanFile):
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version).major == 9 and Version(self.version) >= "3.12":
             raise ConanInvalidConfiguration("FIXME: GCC 9 produces an internal compiler error locally, and a link error in CCI")
 
+        if is_msvc(self) and self.options.allocator != "system":
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator={self.options.allocator} is not supported by the MSBuild build")
+
+        if self.options.allocator == "jemalloc" and self.dependencies["jemalloc"].options.prefix:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=jemalloc requires jemalloc/*:prefix to be empty")
+        if self.options.allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=mimalloc requires mimalloc/*:override=True")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -243,13 +274,16 @@ class CPythonConan(ConanFile):
         VirtualRunEnv(self).generate(scope="build")
 
         if is_msvc(self):
-            # The msbuild generator only works with Visual Studio
-            deps = MSBuildDeps(self)
-            deps.generate()
-            # The toolchain.props is not injected yet, but it also generates VCVars
-            toolchain = MSBuildToolchain(self)
-            toolchain.properties["IncludeExternals"] = "true"
-            toolchain.generate()
+            for configuration in self._msvc_configurations:
+                # The msbuild generator only works with Visual Studio
+                deps = MSBuildDeps(self)
+                deps.configuration = configuration
+                deps.generate()
+                # The toolchain.props is not injected yet, but it also generates VCVars
+                toolchain = MSBuildToolchain(self)
+                toolchain.configuration = configuration
+                toolchain.properties["IncludeExternals"] = "true"
+                toolchain.generate()
         else:
             self._generate_autotools()
 
@@ -522,17 +556,46 @@ class CPythonConan(ConanFile):
         }
         return archs
 
-    def _msvc_build(self):
-        msbuild = MSBuild(self)
-        msbuild.platform = self._msvc_archs[str(self.settings.arch)]
+    @property
+    def _msvc_configurations(self):
+        # PGO goes through the PGInstrument and PGUpdate configurations of PCbuild, the latter also enables LTCG
+        if self.options.optimizations:
+            return ["PGInstrument", "PGUpdate"]
+        return [str(self.settings.build_type)]
 
+    @property
+    def _pgo_task(self):
+        # Same default as PROFILE_TASK in Makefile.pre.in and build.bat --pgo
+        return str(self.options.get_safe("pgo_task") or "-m test --pgo")
+
+    def _msvc_build(self):
         projects = self._solution_projects
         self.output.info(f"Building {len(projects)} Visual Studio projects: {projects}")
 
         sln = os.path.join(self.source_folder, "PCbuild", "pcbuild.sln")
-        # FIXME: Solution files do not pick up the toolset automatically.
-        cmd = msbuild.command(sln, targets=projects)
-        self.run(f"{cmd} /p:PlatformToolset={msvs_toolset(self)}")
+        for configuration in self._msvc_configurations:
+            msbuild = MSBuild(self)
+            msbuild.build_type = configuration
+            msbuild.platform = self._msvc_archs[str(self.settings.arch)]
+            # FIXME: Solution files do not pick up the toolset automatically.
+            cmd = msbuild.command(sln, targets=projects)
+            self.run(f"{cmd} /p:PlatformToolset={msvs_toolset(self)}")
+            if configuration == "PGInstrument":
+                self._msvc_run_pgo_task()
+
+    def _msvc_run_pgo_task(self):
+        instrumented_path = os.path.join(self._msvc_artifacts_path, "instrumented")
+        # Profile data of a previous training run would be merged into this one
+        rm(self, "*.pgc", instrumented_path)
+        self._copy_essential_dlls(instrumented_path)
+        python_bat = os.path.join(self.source_folder, "python.bat")
+        # Without this check, an interpreter that cannot start would silently produce an unoptimized PGUpdate build
+        self.run(f'"{python_bat}" -c "import sys"')
+        self.output.info(f"Running PGO training task: {self._pgo_task}")
+        # Failures of the test suite only degrade the profile, as in build.bat
+        self.run(f'"{python_bat}" {self._pgo_task}', ignore_errors=True)
+        if not glob.glob(os.path.join(instrumented_path, "*.pgc")):
+            raise ConanException(f"PGO training task '{self._pgo_task}' did not produce any profile data in {instrumented_path}")
 
     def build(self):
         self._patch_sources()
@@ -541,7 +604,10 @@ class CPythonConan(ConanFile):
         else:
             autotools = Autotools(self)
             autotools.configure()
-            autotools.make()
+            make_args = []
+            if self.options.get_safe("pgo_task"):
+                make_args.append(f"PROFILE_TASK='{self.options.pgo_task}'")
+            autotools.make(args=make_args)
 
     @property
     def _msvc_artifacts_path(self):
@@ -558,11 +624,11 @@ class CPythonConan(ConanFile):
     def _msvc_install_subprefix(self):
         return "bin"
 
-    def _copy_essential_dlls(self):
+    def _copy_essential_dlls(self, dest_path=None):
         if is_msvc(self):
             # Until MSVC builds support cross building, copy dll's of essential (shared) dependencies to python binary location.
-            # These dll's are required when running the layout tool using the newly built python executable.
-            dest_path = os.path.join(self.build_folder, self._msvc_artifacts_path)
+            # These dll's are required when running the layout tool (or the PGO training task) using the newly built python executable.
+            dest_path = os.path.join(self.build_folder, dest_path or self._msvc_artifacts_path)
             for bin_path in self.dependencies["libffi"].cpp_info.bindirs:
                 copy(self, "*.dll", src=bin_path, dst=dest_path)
             for bin_path in self.dependencies["expat"].cpp_info.bindirs:
@@ -847,6 +913,8 @@ class CPythonConan(ConanFile):
             "pkg_config_aliases", [f"python{py_version.major}-embed"]
         )
         self.cpp_info.components["embed"].requires = ["python"]
+        if self._allocator_requirement:
+            self.cpp_info.components["embed"].requires.append(self._allocator_requirement)
 
         # Transparent integration with CMake's FindPython(3)
         self.cpp_info.set_property("cmake_file_name", "Python3")
@@ -39,6 +39,7 @@ class DuckdbConan(ConanFile):
         "with_shell": [True, False],
         "with_threads": [True, False],
         "with_rdtsc": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc", "tcmalloc"],
     }
     default_options = {
         "shared": False,
@@ -59,6 +60,7 @@ class DuckdbConan(ConanFile):
         "with_shell": False,
         "with_threads": True,
         "with_rdtsc": False,
+        "allocator": "system",
     }
     short_paths = True
 
@@ -75,10 +77,20 @@ class DuckdbConan(ConanFile):
         if Version(self.version) >= "1.1.0":
             del self.options.with_odbc
 
+    @property
+    def _skips_jemalloc_extension(self):
+        # SKIP_EXTENSIONS is supported since 0.10.0
+        return self.options.allocator != "system" and Version(self.version) >= "0.10.0"
+
     def configure(self):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.allocator == "jemalloc":
+            self.options["jemalloc"].prefix = ""
+        elif self.options.allocator == "mimalloc":
+            self.options["mimalloc"].override = True
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -88,6 +100,12 @@ class DuckdbConan(ConanFile):
             self.requires("odbc/2.3.11")
         if self.options.with_httpfs:
             self.requires("openssl/[>=1.1 <4]")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.1.9")
+        elif self.options.allocator == "tcmalloc":
+            self.requires("gperftools/2.16")
 
     def validate(self):
         if self.settings.compiler.cppstd:
@@ -97,6 +115,14 @@ class DuckdbConan(ConanFile):
                 is_msvc(self) and self.options.shared and self.settings.build_type == "Debug":
             raise ConanInvalidConfiguration(f"{self.ref} does not support MSVC debug shared build")
 
+        if self.options.allocator != "system" and not self._skips_jemalloc_extension and self.settings.os == "Linux":
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator={self.options.allocator} requires duckdb >= 0.10.0 on Linux, "
+                                            "older versions cannot skip their bundled jemalloc extension")
+        if self.options.allocator == "jemalloc" and self.dependencies["jemalloc"].options.prefix:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=jemalloc requires jemalloc/*:prefix to be empty")
+        if self.options.allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=mimalloc requires mimalloc/*:override=True")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
 
@@ -132,6 +158,9 @@ class DuckdbConan(ConanFile):
         if self.options.with_sqlsmith:
             build_extensions += ";sqlsmith"
         tc.variables["BUILD_EXTENSIONS"] = build_extensions
+        if self._skips_jemalloc_extension:
+            # the bundled jemalloc extension would bypass the malloc of the selected allocator
+            tc.variables["SKIP_EXTENSIONS"] = "jemalloc"
 
         if "with_odbc" in self.options:
             tc.variables["BUILD_ODBC_DRIVER"] = self.options.with_odbc
@@ -219,7 +248,7 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("visualizer_extension")
             if self.options.with_httpfs:
                 self.cpp_info.libs.append("httpfs_extension")
-            if (self.settings.os == "Linux" and
+            if (not self._skips_jemalloc_extension and self.settings.os == "Linux" and
                 (Version(self.version) < "0.10.1" or self.settings.arch == "x86_64")):
                 self.cpp_info.libs.append("jemalloc_extension")
             if self.options.with_json:
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.cmake import CMake, cmake_layout, CMakeToolchain
 from conan.tools.files import apply_conandata_patches, export_conandata_patches, copy, get, rmdir
 import os
@@ -19,10 +20,23 @@ class EigenConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "MPL2_only": [True, False],
+        "blas_backend": ["none", "openblas"],
+        "threading": ["none", "openmp"],
     }
     default_options = {
         "MPL2_only": False,
+        "blas_backend": "none",
+        "threading": "none",
     }
+    options_description = {
+        "MPL2_only": "Disable the LGPL-licensed parts of Eigen (EIGEN_MPL2_ONLY)",
+        "blas_backend": "Forward large products and decompositions to an external BLAS/LAPACKE (EIGEN_USE_BLAS, EIGEN_USE_LAPACKE)",
+        "threading": "Parallelize matrix products with OpenMP",
+    }
+
+    @property
+    def _with_llvm_openmp(self):
+        return self.options.threading == "openmp" and self.settings.compiler in ["clang", "apple-clang"]
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -33,9 +47,19 @@ class EigenConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def requirements(self):
+        if self.options.blas_backend == "openblas":
+            self.requires("openblas/0.3.27", transitive_headers=True, transitive_libs=True)
+        if self._with_llvm_openmp:
+            self.requires("llvm-openmp/17.0.6", transitive_headers=True, transitive_libs=True)
+
     def package_id(self):
         self.info.clear()
 
+    def validate(self):
+        if self.options.blas_backend == "openblas" and not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref}:blas_backend=openblas requires -o openblas/*:build_lapack=True for LAPACKE")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
             destination=self.source_folder, strip_root=True)
@@ -69,7 +93,21 @@ class EigenConan(ConanFile):
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["eigen3"].system_libs = ["m"]
         if self.options.MPL2_only:
-            self.cpp_info.components["eigen3"].defines = ["EIGEN_MPL2_ONLY"]
+            self.cpp_info.components["eigen3"].defines.append("EIGEN_MPL2_ONLY")
+        if self.options.blas_backend == "openblas":
+            self.cpp_info.components["eigen3"].defines.extend(["EIGEN_USE_BLAS", "EIGEN_USE_LAPACKE"])
+            self.cpp_info.components["eigen3"].requires.append("openblas::openblas_component")
+        if self.options.threading == "openmp":
+            # Eigen parallelizes its products as soon as OpenMP is enabled in the consumer translation units
+            if self._with_llvm_openmp:
+                self.cpp_info.components["eigen3"].requires.append("llvm-openmp::llvm-openmp")
+            elif self.settings.compiler == "msvc":
+                self.cpp_info.components["eigen3"].cxxflags.append("/openmp")
+            elif self.settings.compiler in ["gcc", "intel-cc"]:
+                openmp_flags = ["-fopenmp"] if self.settings.compiler == "gcc" else ["-qopenmp"]
+                self.cpp_info.components["eigen3"].cxxflags.extend(openmp_flags)
+                self.cpp_info.components["eigen3"].sharedlinkflags.extend(openmp_flags)
+                self.cpp_info.components["eigen3"].exelinkflags.extend(openmp_flags)
 
         # TODO: to remove in conan v2 once cmake_find_package* & pkg_config generators removed
         self.cpp_info.names["cmake_find_package"] = "Eigen3"
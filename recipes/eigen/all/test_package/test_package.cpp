@@ -1,5 +1,6 @@
 #include <iostream>
 #include <Eigen/Core>
+#include <Eigen/LU>
 #include <unsupported/Eigen/MatrixFunctions>
 
 
@@ -12,5 +13,13 @@ int main(void)
     std::cout << "A =\n" << A << "\n\n"
               << "A(2..3,:) =\n" << A.middleRows(2, 2) << "\n";
 
+    // Dispatched to BLAS/LAPACKE and OpenMP when enabled: products below
+    // EIGEN_GEMM_TO_COEFFBASED_THRESHOLD use the lazy coefficient-based path instead
+    int const M = 64;
+    Eigen::MatrixXd B = Eigen::MatrixXd::Identity(M, M) * 2.0;
+    Eigen::MatrixXd C = B * B;
+    Eigen::PartialPivLU<Eigen::MatrixXd> lu(C);
+    std::cout << "det(C) = " << lu.determinant() << " (threads: " << Eigen::nbThreads() << ")\n";
+
     return 0;
 }
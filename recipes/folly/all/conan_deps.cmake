@@ -35,6 +35,10 @@ custom_find_package(ZLIB ZLIB)
 custom_find_package(Zstd ZSTD)
 custom_find_package(fmt FMT REQUIRED)
 
+if (FOLLY_USE_JEMALLOC)
+    custom_find_package(Jemalloc JEMALLOC REQUIRED)
+endif()
+
 if (NOT MSVC)
     custom_find_package(LibDwarf LIBDWARF)
 endif()
@@ -26,10 +26,12 @@ class FollyConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc", "tcmalloc"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "allocator": "system",
     }
 
     @property
@@ -62,6 +64,11 @@ class FollyConan(ConanFile):
             self.package_type = "static-library"
             del self.options.shared
 
+        if self.options.allocator == "jemalloc":
+            self.options["jemalloc"].prefix = ""
+        elif self.options.allocator == "mimalloc":
+            self.options["mimalloc"].override = True
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -88,11 +95,25 @@ class FollyConan(ConanFile):
             self.requires("liburing/2.6")
         # INFO: Folly does not support fmt 11 on MSVC: https://github.com/facebook/folly/issues/2250
         self.requires("fmt/10.2.1", transitive_headers=True, transitive_libs=True)
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.1.9")
+        elif self.options.allocator == "tcmalloc":
+            self.requires("gperftools/2.16")
 
     def build_requirements(self):
         # INFO: Required due ZIP_LISTS CMake feature in conan_deps.cmake
         self.tool_requires("cmake/[>=3.17 <4]")
 
+    @property
+    def _allocator_requirement(self):
+        return {
+            "jemalloc": "jemalloc::jemalloc",
+            "mimalloc": "mimalloc::mimalloc",
+            "tcmalloc": "gperftools::gperftools",
+        }.get(str(self.options.allocator))
+
     @property
     def _required_boost_components(self):
         return ["context", "filesystem", "program_options", "regex", "system", "thread"]
@@ -128,6 +149,11 @@ class FollyConan(ConanFile):
             required_components = ", ".join(self._required_boost_components)
             raise ConanInvalidConfiguration(f"{self.ref} requires these Boost components: {required_components}. Try with '-o boost/*:without_{required_components}=False'")
 
+        if self.options.allocator == "jemalloc" and self.dependencies["jemalloc"].options.prefix:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=jemalloc requires jemalloc/*:prefix to be empty")
+        if self.options.allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=mimalloc requires mimalloc/*:override=True")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=False)
 
@@ -171,6 +197,9 @@ class FollyConan(ConanFile):
             tc.cache_variables["BOOST_LINK_STATIC"] = not self.dependencies["boost"].options.shared
 
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0074"] = "NEW"  # Honor Boost_ROOT set by boost recipe
+        # Folly calls the jemalloc extended API (mallocx, sdallocx...) directly when FOLLY_USE_JEMALLOC is set,
+        # never pick a system jemalloc otherwise
+        tc.cache_variables["FOLLY_USE_JEMALLOC"] = self.options.allocator == "jemalloc"
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -180,6 +209,7 @@ class FollyConan(ConanFile):
         deps.set_property("fmt", "cmake_file_name", "fmt")
         deps.set_property("gflags", "cmake_file_name", "Gflags")
         deps.set_property("glog", "cmake_file_name", "Glog")
+        deps.set_property("jemalloc", "cmake_file_name", "Jemalloc")
         deps.set_property("libdwarf", "cmake_file_name", "LibDwarf")
         deps.set_property("libevent", "cmake_file_name", "LibEvent")
         deps.set_property("libiberty", "cmake_file_name", "Libiberty")
@@ -253,6 +283,8 @@ class FollyConan(ConanFile):
             self.cpp_info.components["libfolly"].defines.extend(["FOLLY_HAVE_ELF", "FOLLY_HAVE_DWARF"])
         elif self.settings.os == "Windows":
             self.cpp_info.components["libfolly"].system_libs.extend(["ws2_32", "iphlpapi", "crypt32"])
+        if self._allocator_requirement:
+            self.cpp_info.components["libfolly"].requires.append(self._allocator_requirement)
 
         if  self.settings.get_safe("compiler.libcxx") == "libstdc++" or \
             (self.settings.compiler == "apple-clang" and Version(self.settings.compiler.version.value) == "9.0" and \
@@ -43,8 +43,19 @@ class GoogleCloudCppConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     package_type = "library"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        # Comma separated list of components (e.g. "storage,pubsub,spanner").
+        # Their dependencies are added automatically. All the components are
+        # built if not set.
+        "components": [None, "ANY"],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "components": None,
+    }
     exports = ["components_2_15_1.py",
                "components_2_19_0.py",
                "components_2_28_0.py",
@@ -71,6 +82,24 @@ class GoogleCloudCppConan(ConanFile):
     _REQUIRES_CUSTOM_DEPENDENCIES = {
         "bigquery", "bigtable", "iam", "oauth2", "pubsub", "spanner", "storage",
     }
+    # Components which do not use gRPC.
+    _REST_ONLY_COMPONENTS = {"oauth2", "storage"}
+    # A small number of gRPC-generated stubs are used directly in the common components
+    # shared by all gRPC-based libraries.  These must be defined without reference to `grpc_utils`.
+    _GRPC_UTILS_REQUIRED_PROTOS = {
+        "iam_credentials_v1_iamcredentials_protos",
+        "iam_v1_policy_protos",
+        "longrunning_operations_protos",
+        "rpc_error_details_protos",
+        "rpc_status_protos",
+    }
+    # Common components shared by other compute components
+    _COMPUTE_COMMON_COMPONENTS = [
+        'compute_global_operations',
+        'compute_global_organization_operations',
+        'compute_region_operations',
+        'compute_zone_operations',
+    ]
 
     @property
     def _is_legacy_one_profile(self):
@@ -89,6 +118,12 @@ class GoogleCloudCppConan(ConanFile):
             self.options["protobuf"].shared = True
             self.options["grpc"].shared = True
 
+    def package_id(self):
+        # "pubsub, storage" and "storage,pubsub" select the same binary
+        if self.info.options.components:
+            components = str(self.info.options.components).split(",")
+            self.info.options.components = ",".join(sorted(set(c.strip() for c in components if c.strip())))
+
     def validate(self):
         # As-of 2022-03, google-cloud-cpp only supports "Visual Studio >= 2019",
         # and Visual Studio < 2019 is out of mainline support.
@@ -119,6 +154,14 @@ class GoogleCloudCppConan(ConanFile):
                 f"The inter-component components are unknown for version {self.version}. Expected one of {self._PROTO_COMPONENT_DEPENDENCIES.keys()}"
             )
 
+        available = self._all_components()
+        has_compute = any(c.startswith("compute_") for c in available)
+        unknown = [c for c in self._requested_components() if c not in available and not (c == "compute" and has_compute)]
+        if unknown:
+            raise ConanInvalidConfiguration(
+                f"{self.ref}:components contains unknown or unsupported components for this configuration: {', '.join(sorted(unknown))}"
+            )
+
         if (
             self.settings.compiler == "clang"
             and Version(self.settings.compiler.version) < "6.0"
@@ -134,7 +177,7 @@ class GoogleCloudCppConan(ConanFile):
         ):
             raise ConanInvalidConfiguration("Building requires GCC >= 5.4")
 
-        if self.info.options.shared and \
+        if self.info.options.shared and self._uses_grpc(self._components()) and \
            (not self.dependencies["protobuf"].options.shared or \
             not self.dependencies["grpc"].options.shared):
             raise ConanInvalidConfiguration(
@@ -148,12 +191,16 @@ class GoogleCloudCppConan(ConanFile):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
 
     def requirements(self):
+        components = self._components()
         # These must remain pinned in conan index.
-        self.requires("protobuf/3.21.12", transitive_headers=True)
+        if self._uses_grpc(components):
+            self.requires("protobuf/3.21.12", transitive_headers=True)
         self.requires("abseil/[>=20230125.3 <=20230802.1]", transitive_headers=True)
-        self.requires("grpc/1.54.3", transitive_headers=True)
+        if self._uses_grpc(components):
+            self.requires("grpc/1.54.3", transitive_headers=True)
         self.requires("nlohmann_json/3.11.3")
-        self.requires("crc32c/1.1.2")
+        if "storage" in components:
+            self.requires("crc32c/1.1.2")
         # The rest require less pinning.
         self.requires("libcurl/[>=7.78 <9]")
         self.requires("openssl/[>=1.1 <4]")
@@ -161,7 +208,7 @@ class GoogleCloudCppConan(ConanFile):
 
     def build_requirements(self):
         # For the `grpc-cpp-plugin` executable, and indirectly `protoc`
-        if not self._is_legacy_one_profile:
+        if not self._is_legacy_one_profile and self._uses_grpc(self._components()):
             self.tool_requires("grpc/<host_version>")
 
     def generate(self):
@@ -212,7 +259,70 @@ class GoogleCloudCppConan(ConanFile):
         'storagetransfer',
     }
 
+    def _requested_components(self):
+        if not self.options.components:
+            return []
+        return [c.strip() for c in str(self.options.components).split(",") if c.strip()]
+
+    def _proto_closure(self, protos):
+        deps = self._PROTO_COMPONENT_DEPENDENCIES.get(str(self.version), dict())
+        result = set()
+        pending = list(protos)
+        while pending:
+            proto = pending.pop()
+            if proto in result:
+                continue
+            result.add(proto)
+            pending.extend(d for d in deps.get(proto, []) if d.endswith("_protos"))
+        return result
+
+    def _component_protos(self, component):
+        # Individual compute proto libraries were replaced with a single
+        # `compute_protos` library.
+        if component.startswith("compute_") and Version(self.version) >= '2.28.0':
+            return "compute_protos"
+        return f"{component}_protos"
+
+    def _selected_components(self):
+        """The requested components and all the components they depend on,
+        or `None` if all the components are built."""
+        requested = self._requested_components()
+        if not requested:
+            return None
+        available = self._all_components()
+        result = set()
+        pending = list(requested)
+        while pending:
+            component = pending.pop()
+            if component in result:
+                continue
+            if component == "compute":
+                # `compute` is an interface library grouping all the compute libraries
+                pending.extend(c for c in available if c.startswith("compute_"))
+                continue
+            result.add(component)
+            if component.startswith("compute_"):
+                pending.extend(self._COMPUTE_COMMON_COMPONENTS)
+            if component in self._REST_ONLY_COMPONENTS:
+                continue
+            # A dependency on `<name>_protos` requires the `<name>` component
+            for proto in self._proto_closure([self._component_protos(component)]):
+                name = proto[:-len("_protos")]
+                if name in available:
+                    pending.append(name)
+        return result
+
+    def _uses_grpc(self, components):
+        return any(c not in self._REST_ONLY_COMPONENTS for c in components)
+
     def _components(self):
+        result = self._all_components()
+        selected = self._selected_components()
+        if selected is not None:
+            result = [c for c in result if c in selected]
+        return result
+
+    def _all_components(self):
         result = self._GA_COMPONENTS.get(str(self.version), []).copy()
         for c in self._SKIPPED_COMPONENTS:
             result.remove(c)
@@ -242,6 +352,13 @@ class GoogleCloudCppConan(ConanFile):
             result.remove('devtools_source_v1_source_context_protos')
         if self.settings.os == "Windows" and Version(self.version) >= '2.28.0':
             result.remove('securitycenter_protos')
+        selected = self._selected_components()
+        if selected is not None:
+            roots = set(self._component_protos(c) for c in selected if c not in self._REST_ONLY_COMPONENTS)
+            if self._uses_grpc(selected):
+                roots.update(self._GRPC_UTILS_REQUIRED_PROTOS)
+            needed = self._proto_closure(roots)
+            result = [c for c in result if c in needed]
         return result
 
     def package(self):
@@ -266,71 +383,64 @@ class GoogleCloudCppConan(ConanFile):
     # with dependencies between them
     def _add_compute_component(self, component, protos):
         SHARED_REQUIRES=["rest_protobuf_internal", "rest_internal", "common"]
-        # Common components shared by other compute components
-        COMPUTE_COMMON_COMPONENTS = [
-            'compute_global_operations',
-            'compute_global_organization_operations',
-            'compute_region_operations',
-            'compute_zone_operations',
-        ]
         requires = [protos]
-        if component not in COMPUTE_COMMON_COMPONENTS:
-            requires = requires + COMPUTE_COMMON_COMPONENTS
+        if component not in self._COMPUTE_COMMON_COMPONENTS:
+            requires = requires + self._COMPUTE_COMMON_COMPONENTS
         self.cpp_info.components[component].requires = requires + SHARED_REQUIRES
         self.cpp_info.components[component].libs = [f"google_cloud_cpp_{component}"]
         self.cpp_info.components[component].names["pkg_config"] = f"google_cloud_cpp_{component}"
 
     def package_info(self):
+        components = self._components()
+        proto_components = self._proto_components()
+        uses_grpc = self._uses_grpc(components)
+
         self.cpp_info.components["common"].requires = ["abseil::absl_any", "abseil::absl_flat_hash_map", "abseil::absl_memory", "abseil::absl_optional", "abseil::absl_time"]
         self.cpp_info.components["common"].libs = ["google_cloud_cpp_common"]
         self.cpp_info.components["common"].names["pkg_config"] = "google_cloud_cpp_common"
 
         self.cpp_info.components["rest_internal"].requires = ["common", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
+        if not {"oauth2", "storage"} & set(components):
+            # Only used privately, but every requirement must be used by a component
+            self.cpp_info.components["rest_internal"].requires.append("nlohmann_json::nlohmann_json")
         self.cpp_info.components["rest_internal"].libs = ["google_cloud_cpp_rest_internal"]
         self.cpp_info.components["rest_internal"].names["pkg_config"] = "google_cloud_cpp_rest_internal"
 
-        # A small number of gRPC-generated stubs are used directly in the common components
-        # shared by all gRPC-based libraries.  These must be defined without reference to `grpc_utils`.
-        GRPC_UTILS_REQUIRED_PROTOS = {
-            "iam_credentials_v1_iamcredentials_protos",
-            "iam_v1_policy_protos",
-            "longrunning_operations_protos",
-            "rpc_error_details_protos",
-            "rpc_status_protos",
-        }
-        for component in GRPC_UTILS_REQUIRED_PROTOS:
-            self._add_proto_component(component)
+        if uses_grpc:
+            for component in self._GRPC_UTILS_REQUIRED_PROTOS:
+                self._add_proto_component(component)
 
-        self.cpp_info.components["grpc_utils"].requires = list(GRPC_UTILS_REQUIRED_PROTOS) + ["common", "abseil::absl_function_ref", "abseil::absl_memory", "abseil::absl_time", "grpc::grpc++", "grpc::_grpc"]
-        self.cpp_info.components["grpc_utils"].libs = ["google_cloud_cpp_grpc_utils"]
-        self.cpp_info.components["grpc_utils"].names["pkg_config"] = "google_cloud_cpp_grpc_utils"
+            self.cpp_info.components["grpc_utils"].requires = list(self._GRPC_UTILS_REQUIRED_PROTOS) + ["common", "abseil::absl_function_ref", "abseil::absl_memory", "abseil::absl_time", "grpc::grpc++", "grpc::_grpc"]
+            self.cpp_info.components["grpc_utils"].libs = ["google_cloud_cpp_grpc_utils"]
+            self.cpp_info.components["grpc_utils"].names["pkg_config"] = "google_cloud_cpp_grpc_utils"
 
-        for component in self._proto_components():
+        for component in proto_components:
             if component == 'storage_protos':
                 # The `storage_protos` are compiled only when needed. They are
                 # not used in Conan because they are only needed for an
                 # experimental library, supporting an allow-listed service.
                 continue
-            if component not in GRPC_UTILS_REQUIRED_PROTOS:
+            if component not in self._GRPC_UTILS_REQUIRED_PROTOS:
                 self._add_proto_component(component)
 
         # Interface libraries for backwards compatibility
-        self.cpp_info.components["cloud_bigquery_protos"].requires = ["bigquery_protos"]
-        self.cpp_info.components["cloud_dialogflow_v2_protos"].requires = ["dialogflow_es_protos"]
-        self.cpp_info.components["cloud_speech_protos"].requires = ["speech_protos"]
-        self.cpp_info.components["cloud_texttospeech_protos"].requires = ["texttospeech_protos"]
-        self.cpp_info.components["devtools_cloudtrace_v2_trace_protos"].requires = ["trace_protos"]
-        self.cpp_info.components["devtools_cloudtrace_v2_tracing_protos"].requires = ["trace_protos"]
-        self.cpp_info.components["logging_type_type_protos"].requires = ["logging_type_protos"]
-
-        for component in self._components():
-            protos=f"{component}_protos"
+        COMPAT_PROTOS = {
+            "cloud_bigquery_protos": "bigquery_protos",
+            "cloud_dialogflow_v2_protos": "dialogflow_es_protos",
+            "cloud_speech_protos": "speech_protos",
+            "cloud_texttospeech_protos": "texttospeech_protos",
+            "devtools_cloudtrace_v2_trace_protos": "trace_protos",
+            "devtools_cloudtrace_v2_tracing_protos": "trace_protos",
+            "logging_type_type_protos": "logging_type_protos",
+        }
+        for compat, protos in COMPAT_PROTOS.items():
+            if protos in proto_components:
+                self.cpp_info.components[compat].requires = [protos]
+
+        for component in components:
+            protos = self._component_protos(component)
             # `compute` components do not depend on gRPC
             if component.startswith("compute_"):
-                # Individual compute proto libraries were replaced with a single
-                # `compute_protos` library.
-                if Version(self.version) >= '2.28.0':
-                    protos = "compute_protos"
                 self._add_compute_component(component, protos)
                 continue
             # `storage` is the only component that does not depend on a matching `*_protos` library
@@ -338,23 +448,32 @@ class GoogleCloudCppConan(ConanFile):
                 continue
             self._add_grpc_component(component, protos)
 
-        self._add_grpc_component("bigtable", "bigtable_protos")
-        self._add_grpc_component("iam", "iam_protos")
-        self._add_grpc_component("pubsub", "pubsub_protos", ["abseil::absl_flat_hash_map"])
-        self._add_grpc_component("spanner", "spanner_protos",  ["abseil::absl_fixed_array", "abseil::absl_numeric", "abseil::absl_strings", "abseil::absl_time"])
+        if "bigtable" in components:
+            self._add_grpc_component("bigtable", "bigtable_protos")
+        if "iam" in components:
+            self._add_grpc_component("iam", "iam_protos")
+        if "pubsub" in components:
+            self._add_grpc_component("pubsub", "pubsub_protos", ["abseil::absl_flat_hash_map"])
+        if "spanner" in components:
+            self._add_grpc_component("spanner", "spanner_protos",  ["abseil::absl_fixed_array", "abseil::absl_numeric", "abseil::absl_strings", "abseil::absl_time"])
 
         if Version(self.version) >= '2.19.0':
-            self.cpp_info.components["rest_protobuf_internal"].requires = ["rest_internal", "grpc_utils", "common"]
-            self.cpp_info.components["rest_protobuf_internal"].libs = ["google_cloud_cpp_rest_protobuf_internal"]
-            self.cpp_info.components["rest_protobuf_internal"].names["pkg_config"] = "google_cloud_cpp_rest_protobuf_internal"
+            if uses_grpc:
+                self.cpp_info.components["rest_protobuf_internal"].requires = ["rest_internal", "grpc_utils", "common"]
+                self.cpp_info.components["rest_protobuf_internal"].libs = ["google_cloud_cpp_rest_protobuf_internal"]
+                self.cpp_info.components["rest_protobuf_internal"].names["pkg_config"] = "google_cloud_cpp_rest_protobuf_internal"
             # The `google-cloud-cpp::compute` interface library groups all the compute
             # libraries in a single target.
-            self.cpp_info.components["compute"].requires = [c for c in self._components() if c.startswith("compute_")]
+            compute_components = [c for c in components if c.startswith("compute_")]
+            if compute_components:
+                self.cpp_info.components["compute"].requires = compute_components
             # The `google-cloud-cpp::oauth2` library does not depend on gRPC or any protos.
-            self.cpp_info.components["oauth2"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
-            self.cpp_info.components["oauth2"].libs = ["google_cloud_cpp_oauth2"]
-            self.cpp_info.components["oauth2"].names["pkg_config"] = "google_cloud_cpp_oauth2"
-
-        self.cpp_info.components["storage"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "abseil::absl_memory", "abseil::absl_strings", "abseil::absl_str_format", "abseil::absl_time", "abseil::absl_variant", "crc32c::crc32c", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
-        self.cpp_info.components["storage"].libs = ["google_cloud_cpp_storage"]
-        self.cpp_info.components["storage"].names["pkg_config"] = "google_cloud_cpp_storage"
+            if "oauth2" in components:
+                self.cpp_info.components["oauth2"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
+                self.cpp_info.components["oauth2"].libs = ["google_cloud_cpp_oauth2"]
+                self.cpp_info.components["oauth2"].names["pkg_config"] = "google_cloud_cpp_oauth2"
+
+        if "storage" in components:
+            self.cpp_info.components["storage"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "abseil::absl_memory", "abseil::absl_strings", "abseil::absl_str_format", "abseil::absl_time", "abseil::absl_variant", "crc32c::crc32c", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
+            self.cpp_info.components["storage"].libs = ["google_cloud_cpp_storage"]
+            self.cpp_info.components["storage"].names["pkg_config"] = "google_cloud_cpp_storage"
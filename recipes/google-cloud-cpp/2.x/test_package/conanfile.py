@@ -30,9 +30,20 @@ class TestPackageConan(ConanFile):
             return False
         return Version(self.dependencies["google-cloud-cpp"].ref.version) >= "2.19.0"
 
+    def _tests(self):
+        tests = ["bigtable", "pubsub", "spanner", "speech", "storage"]
+        if self._supports_compute():
+            tests.append("compute")
+        components = self.dependencies["google-cloud-cpp"].options.get_safe("components") if hasattr(self, "dependencies") else None
+        if components:
+            # Only test the components which were explicitly requested
+            requested = [c.strip() for c in str(components).split(",")]
+            tests = [t for t in tests if t in requested]
+        return tests
+
     def generate(self):
         tc = CMakeToolchain(self)
-        tc.variables["WITH_COMPUTE"] = self._supports_compute()
+        tc.variables["TESTS"] = ";".join(self._tests())
         tc.generate()
         if self._is_legacy_one_profile:
             VirtualRunEnv(self).generate(scope="build")
@@ -51,9 +62,6 @@ class TestPackageConan(ConanFile):
     def test(self):
         if not can_run(self):
             return
-        for test in ["bigtable", "pubsub", "spanner", "speech", "storage"]:
+        for test in self._tests():
             cmd = os.path.join(self.cpp.build.bindir, test)
             self.run(cmd, env="conanrun")
-        if self._supports_compute():
-            cmd = os.path.join(self.cpp.build.bindir, "compute")
-            self.run(cmd, env="conanrun")
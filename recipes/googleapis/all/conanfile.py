@@ -3,7 +3,7 @@ import glob
 import os
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
@@ -28,10 +28,14 @@ class GoogleAPIS(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        # Comma separated list of Bazel labels (e.g. "//google/rpc:status_cc_proto") to build,
+        # along with their dependencies. All the libraries are built if not set.
+        "components": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "components": None,
     }
     exports = "helpers.py"
     short_paths = True
@@ -40,6 +44,14 @@ class GoogleAPIS(ConanFile):
     def _is_legacy_one_profile(self):
         return not hasattr(self, "settings_build")
 
+    @property
+    def _components(self):
+        if not self.options.components:
+            return []
+        labels = str(self.options.components).replace(";", ",").split(",")
+        return sorted(set(label.strip() if label.strip().startswith("//") else f"//{label.strip()}"
+                          for label in labels if label.strip()))
+
     def export_sources(self):
         copy(self, "CMakeLists.txt", src=self.recipe_folder, dst=os.path.join(self.export_sources_folder, "src"))
         export_conandata_patches(self)
@@ -60,6 +72,10 @@ class GoogleAPIS(ConanFile):
         # https://github.com/conan-io/conan-center-index/pull/15601#issuecomment-1493086506
         self.requires("protobuf/3.21.12", transitive_headers=True, transitive_libs=True)
 
+    def package_id(self):
+        if self.info.options.components:
+            self.info.options.components = ",".join(self._components)
+
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, 11)
@@ -116,8 +132,18 @@ class GoogleAPIS(ConanFile):
                     continue
                 activate_library(all_dict[it_dep])
 
-        for it in filter(lambda u: u.is_used, proto_libraries):
-            activate_library(it)
+        if self._components:
+            # Only build the requested libraries (and their dependencies)
+            unknown = [label for label in self._components if label not in all_dict]
+            if unknown:
+                raise ConanException(f"{self.ref}:components contains unknown Bazel labels: {', '.join(unknown)}")
+            for it in proto_libraries:
+                it.is_used = False
+            for label in self._components:
+                activate_library(all_dict[label])
+        else:
+            for it in filter(lambda u: u.is_used, proto_libraries):
+                activate_library(it)
 
         # Tweaks
         def deactivate_library(key):
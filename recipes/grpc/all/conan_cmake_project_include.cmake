@@ -2,3 +2,47 @@
 if (TARGET check_epollexclusive)
     set_target_properties(check_epollexclusive PROPERTIES LINKER_LANGUAGE CXX)
 endif()
+
+# Allocator selected by the recipe, linked to all the targets defined after this point
+if(CONAN_GRPC_ALLOCATOR_PACKAGE)
+    find_package(${CONAN_GRPC_ALLOCATOR_PACKAGE} REQUIRED CONFIG)
+    link_libraries(${CONAN_GRPC_ALLOCATOR_TARGET})
+endif()
+
+# Targets disabled by recipe options: gRPC has no switch for them, so they are skipped explicitly.
+# They are kept out of the default build once all targets are defined, and every install(TARGETS)
+# call drops them from its target list.
+if(CONAN_GRPC_EXCLUDED_TARGETS)
+    function(_conan_grpc_exclude_targets)
+        foreach(_conan_target IN LISTS CONAN_GRPC_EXCLUDED_TARGETS)
+            if(TARGET ${_conan_target})
+                set_target_properties(${_conan_target} PROPERTIES EXCLUDE_FROM_ALL TRUE)
+            endif()
+        endforeach()
+    endfunction()
+    cmake_language(DEFER DIRECTORY ${CMAKE_SOURCE_DIR} CALL _conan_grpc_exclude_targets)
+
+    function(install type)
+        if(NOT type STREQUAL "TARGETS")
+            _install(${type} ${ARGN})
+            return()
+        endif()
+        # install(TARGETS <target>... [EXPORT <name>] [<artifact-kind>] [DESTINATION ...] ...)
+        set(_conan_targets)
+        set(_conan_args)
+        set(_conan_in_targets TRUE)
+        foreach(_conan_arg IN LISTS ARGN)
+            if(_conan_in_targets AND TARGET ${_conan_arg})
+                if(NOT _conan_arg IN_LIST CONAN_GRPC_EXCLUDED_TARGETS)
+                    list(APPEND _conan_targets ${_conan_arg})
+                endif()
+            else()
+                set(_conan_in_targets FALSE)
+                list(APPEND _conan_args ${_conan_arg})
+            endif()
+        endforeach()
+        if(_conan_targets)
+            _install(TARGETS ${_conan_targets} ${_conan_args})
+        endif()
+    endfunction()
+endif()
@@ -37,8 +37,14 @@ class GrpcConan(ConanFile):
         "python_plugin": [True, False],
         "ruby_plugin": [True, False],
         "otel_plugin": [True, False],
-        "secure": [True, False],
-        "with_libsystemd": [True, False]
+        "secure": [True, False, "deprecated"],
+        "with_libsystemd": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc", "tcmalloc"],
+        "register_xds": [True, False],
+        "with_unsecure": [True, False],
+        "with_reflection": [True, False],
+        "with_channelz": [True, False],
+        "with_authorization_provider": [True, False],
     }
     default_options = {
         "shared": False,
@@ -53,8 +59,23 @@ class GrpcConan(ConanFile):
         "python_plugin": True,
         "ruby_plugin": True,
         "otel_plugin": False,
-        "secure": False,
-        "with_libsystemd": True
+        "secure": "deprecated",
+        "with_libsystemd": True,
+        "allocator": "system",
+        "register_xds": True,
+        "with_unsecure": True,
+        "with_reflection": True,
+        "with_channelz": True,
+        "with_authorization_provider": True,
+    }
+    options_description = {
+        "secure": "Deprecated, use with_unsecure instead",
+        "register_xds": "Register the xDS resolvers and load balancers, False defines GRPC_NO_XDS: no target or component "
+                        "is pruned, shared builds still ship the xDS code and only static consumers get it dropped by the linker",
+        "with_unsecure": "Build and package the grpc_unsecure and grpc++_unsecure libraries",
+        "with_reflection": "Build and package grpc++_reflection",
+        "with_channelz": "Build and package grpcpp_channelz",
+        "with_authorization_provider": "Build and package grpc_authorization_provider",
     }
 
     _target_info = None
@@ -86,8 +107,13 @@ class GrpcConan(ConanFile):
             del self.options.with_libsystemd
         if Version(self.version) < "1.65.0":
             del self.options.otel_plugin
+        if Version(self.version) < "1.54.0":
+            del self.options.with_authorization_provider
 
     def configure(self):
+        if self.options.secure != "deprecated":
+            self.output.warning(f"{self.name}:secure option is deprecated, use with_unsecure instead.")
+            self.options.with_unsecure = not self.options.secure
         if self.options.shared:
             self.options.rm_safe("fPIC")
             self.options["protobuf"].shared = True
@@ -95,6 +121,17 @@ class GrpcConan(ConanFile):
             if cross_building(self):
                 self.options["grpc"].shared = True
 
+        # reflection and channelz libraries are only built with codegen
+        if not self.options.codegen:
+            self.options.rm_safe("with_reflection")
+            self.options.rm_safe("with_channelz")
+
+        # the allocator must replace malloc/free of the final binary: unprefixed jemalloc, overriding mimalloc
+        if self.options.allocator == "jemalloc":
+            self.options["jemalloc"].prefix = ""
+        elif self.options.allocator == "mimalloc":
+            self.options["mimalloc"].override = True
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -120,6 +157,12 @@ class GrpcConan(ConanFile):
                 self.requires("libsystemd/255.10")
             else:
                 self.requires("libsystemd/255")
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.1.9")
+        elif self.options.allocator == "tcmalloc":
+            self.requires("gperftools/2.16")
         if self.options.get_safe("otel_plugin"):
             self.requires("opentelemetry-cpp/1.14.2")
 
@@ -148,6 +191,12 @@ class GrpcConan(ConanFile):
         if abseil_cppstd != self.settings.compiler.cppstd:
             raise ConanInvalidConfiguration(f"grpc and abseil must be built with the same compiler.cppstd setting")
 
+        # configure() only sets defaults, a profile can still ask for a prefixed jemalloc or a non-overriding mimalloc
+        if self.options.allocator == "jemalloc" and self.dependencies["jemalloc"].options.prefix:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=jemalloc requires jemalloc/*:prefix to be empty")
+        if self.options.allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=mimalloc requires mimalloc/*:override=True")
+
     def build_requirements(self):
         # cmake >=3.25 required to use `cmake -E env --modify` below
         # note: grpc 1.69.0 requires cmake >=3.16
@@ -216,6 +265,22 @@ class GrpcConan(ConanFile):
         if Version(self.version) >= "1.62.0":
             tc.cache_variables["gRPC_DOWNLOAD_ARCHIVES"] = False
 
+        if not self.options.register_xds:
+            # xDS sources are still compiled, but nothing registers them anymore
+            # so the linker drops them from static consumers
+            tc.preprocessor_definitions["GRPC_NO_XDS"] = "1"
+        if self.options.allocator != "system":
+            # gRPC has no allocator switch of its own: link the allocator into every gRPC library and plugin
+            allocator_package, allocator_target = {
+                "jemalloc": ("jemalloc", "jemalloc::jemalloc"),
+                "mimalloc": ("mimalloc", "mimalloc" if self.dependencies["mimalloc"].options.shared else "mimalloc-static"),
+                "tcmalloc": ("gperftools", "gperftools::gperftools"),
+            }[str(self.options.allocator)]
+            tc.cache_variables["CONAN_GRPC_ALLOCATOR_PACKAGE"] = allocator_package
+            tc.cache_variables["CONAN_GRPC_ALLOCATOR_TARGET"] = allocator_target
+        if self._excluded_targets:
+            tc.cache_variables["CONAN_GRPC_EXCLUDED_TARGETS"] = ";".join(self._excluded_targets)
+
         tc.generate()
 
         cmake_deps = CMakeDeps(self)
@@ -313,6 +378,27 @@ class GrpcConan(ConanFile):
     def _module_path(self):
         return os.path.join("lib", "cmake", "conan_trick")
 
+    @property
+    def _allocator_requirement(self):
+        return {
+            "jemalloc": "jemalloc::jemalloc",
+            "mimalloc": "mimalloc::mimalloc",
+            "tcmalloc": "gperftools::gperftools",
+        }.get(str(self.options.allocator))
+
+    @property
+    def _excluded_targets(self):
+        excluded = []
+        if not self.options.with_unsecure:
+            excluded.extend(["grpc_unsecure", "grpc++_unsecure"])
+        if not self.options.get_safe("with_reflection", True):
+            excluded.append("grpc++_reflection")
+        if not self.options.get_safe("with_channelz", True):
+            excluded.append("grpcpp_channelz")
+        if not self.options.get_safe("with_authorization_provider", True):
+            excluded.append("grpc_authorization_provider")
+        return excluded
+
     @property
     def _grpc_components(self):
         system_libs = []
@@ -326,10 +412,10 @@ class GrpcConan(ConanFile):
         targets = self.target_info['grpc_targets']
         components = {}
         for target in targets:
-            if self.options.secure and target['name'] in ["grpc_unsecure", "grpc++_unsecure"]:
-                continue
             if not self.options.codegen and target['name'] in ["grpc++_reflection", "grpcpp_channelz"]:
                 continue
+            if target['name'] in self._excluded_targets:
+                continue
             components[target['name']] = {
                 "lib": target['lib'],
                 "requires": target.get('requires', []) + libsystemd,
@@ -357,6 +443,9 @@ class GrpcConan(ConanFile):
             if is_apple_os(self):
                 self.cpp_info.components[component].frameworks = values.get("frameworks", [])
 
+        if self._allocator_requirement:
+            self.cpp_info.components["gpr"].requires.append(self._allocator_requirement)
+
         # Executable imported targets are added through custom CMake module files,
         # since conan generators don't know how to emulate these kind of targets.
         grpc_modules = []
@@ -35,6 +35,11 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "enable_stats": [True, False],
+        "lg_page": [None] + list(range(12, 17)),
+        "lg_quantum": [None, 3, 4],
+        "lg_hugepage": [None] + list(range(21, 31)),
+        "malloc_conf": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -50,6 +55,18 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "enable_stats": True,
+        "lg_page": None,
+        "lg_quantum": None,
+        "lg_hugepage": None,
+        "malloc_conf": None,
+    }
+    options_description = {
+        "lg_page": "Base 2 log of the system page size (--with-lg-page), detected on the build machine if not set",
+        "lg_quantum": "Base 2 log of the minimum allocation alignment (--with-lg-quantum)",
+        "lg_hugepage": "Base 2 log of the system huge page size (--with-lg-hugepage)",
+        "enable_stats": "Enable statistics gathering (--enable-stats)",
+        "malloc_conf": "Default options string embedded in the library (--with-malloc-conf), e.g. background_thread:true",
     }
 
     @property
@@ -124,6 +141,11 @@ class JemallocConan(ConanFile):
         if self.settings.os == "Macos" and self.settings.arch == "armv8":
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
+        # 4. Options checks
+        if self.options.lg_page and self.options.lg_hugepage and int(str(self.options.lg_hugepage)) <= int(str(self.options.lg_page)):
+            raise ConanInvalidConfiguration("lg_hugepage must be greater than lg_page.")
+        if self.options.malloc_conf and any(c.isspace() for c in str(self.options.malloc_conf)):
+            raise ConanInvalidConfiguration("malloc_conf must not contain whitespaces.")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -146,7 +168,16 @@ class JemallocConan(ConanFile):
             enable_disable("initial-exec-tls", self.options.enable_initial_exec_tls),
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
+            enable_disable("stats", self.options.enable_stats),
         ])
+        if self.options.lg_page:
+            tc.configure_args.append(f"--with-lg-page={self.options.lg_page}")
+        if self.options.lg_quantum:
+            tc.configure_args.append(f"--with-lg-quantum={self.options.lg_quantum}")
+        if self.options.lg_hugepage:
+            tc.configure_args.append(f"--with-lg-hugepage={self.options.lg_hugepage}")
+        if self.options.malloc_conf:
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
@@ -21,10 +21,21 @@ class LZ4Conan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "memory_usage": [None] + list(range(10, 21)),
+        "heap_mode": [True, False],
+        "fast_dec_loop": ["auto", True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "memory_usage": None,
+        "heap_mode": False,
+        "fast_dec_loop": "auto",
+    }
+    options_description = {
+        "memory_usage": "Log2 of the hash table size in bytes (LZ4_MEMORY_USAGE), upstream default is 14",
+        "heap_mode": "Allocate compression state on the heap instead of the stack (LZ4_HEAPMODE)",
+        "fast_dec_loop": "Use the fast decoder loop (LZ4_FAST_DEC_LOOP), auto lets lz4 decide from arch and compiler",
     }
 
     def export_sources(self):
@@ -53,6 +64,12 @@ class LZ4Conan(ConanFile):
         if Version(self.version) < "1.10.0":
             tc.variables["LZ4_BUILD_LEGACY_LZ4C"] = False
         tc.variables["LZ4_BUNDLED_MODE"] = False
+        if self.options.memory_usage:
+            tc.preprocessor_definitions["LZ4_MEMORY_USAGE"] = str(self.options.memory_usage)
+        if self.options.heap_mode:
+            tc.preprocessor_definitions["LZ4_HEAPMODE"] = "1"
+        if self.options.fast_dec_loop != "auto":
+            tc.preprocessor_definitions["LZ4_FAST_DEC_LOOP"] = "1" if self.options.fast_dec_loop else "0"
         tc.variables["LZ4_POSITION_INDEPENDENT_LIB"] = self.options.get_safe("fPIC", True)
         # Generate a relocatable shared lib on Macos
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0042"] = "NEW"
@@ -94,3 +111,6 @@ class LZ4Conan(ConanFile):
         self.cpp_info.libs = ["lz4"]
         if is_msvc(self) and self.options.shared:
             self.cpp_info.defines.append("LZ4_DLL_IMPORT=1")
+        if self.options.memory_usage:
+            # Size of LZ4_stream_t in lz4.h depends on it
+            self.cpp_info.defines.append(f"LZ4_MEMORY_USAGE={self.options.memory_usage}")
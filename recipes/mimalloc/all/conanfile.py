@@ -29,6 +29,10 @@ class MimallocConan(ConanFile):
         "single_object": [True, False],
         "guarded": [True, False],
         "win_redirect": [True, False],
+        "opt_arch": [True, False],
+        "skip_collect_on_exit": [True, False],
+        "padding": [True, False],
+        "local_dynamic_tls": [True, False],
     }
     default_options = {
         "shared": False,
@@ -39,6 +43,16 @@ class MimallocConan(ConanFile):
         "single_object": False,
         "guarded": False,
         "win_redirect": False,
+        "opt_arch": False,
+        "skip_collect_on_exit": False,
+        "padding": True,
+        "local_dynamic_tls": False,
+    }
+    options_description = {
+        "opt_arch": "Architecture specific optimizations, e.g. -march=armv8.1-a on arm64 for atomics (MI_OPT_ARCH)",
+        "skip_collect_on_exit": "Skip collecting memory on program exit (MI_SKIP_COLLECT_ON_EXIT)",
+        "padding": "Add padding to detect heap block overflow in debug and secure modes, disabled with MI_NO_PADDING",
+        "local_dynamic_tls": "Use local-dynamic instead of initial-exec thread local storage (MI_LOCAL_DYNAMIC_TLS)",
     }
 
     def export_sources(self):
@@ -57,6 +71,12 @@ class MimallocConan(ConanFile):
             del self.options.inject
         if Version(self.version) < "2.1.9":
             del self.options.guarded
+            del self.options.opt_arch
+        if Version(self.version) < "1.7.9":
+            del self.options.skip_collect_on_exit
+        if self.settings.os == "Windows":
+            # Thread local storage model only matters for ELF/Mach-O
+            del self.options.local_dynamic_tls
 
     def configure(self):
         if self.options.shared:
@@ -128,6 +148,12 @@ class MimallocConan(ConanFile):
         tc.variables["MI_WIN_REDIRECT"] = "ON" if self.options.get_safe("win_redirect") else "OFF"
         tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
         tc.variables["MI_GUARDED"] = self.options.get_safe("guarded", False)
+        if "opt_arch" in self.options:
+            tc.cache_variables["MI_OPT_ARCH"] = bool(self.options.opt_arch)
+        if "skip_collect_on_exit" in self.options:
+            tc.cache_variables["MI_SKIP_COLLECT_ON_EXIT"] = bool(self.options.skip_collect_on_exit)
+        tc.cache_variables["MI_NO_PADDING"] = not self.options.padding
+        tc.cache_variables["MI_LOCAL_DYNAMIC_TLS"] = bool(self.options.get_safe("local_dynamic_tls", False))
         if Version(self.version) <= "1.7.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
@@ -2,7 +2,7 @@ from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.build import cross_building
-from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
+from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import copy, get, replace_in_file, rmdir
 from conan.tools.microsoft import is_msvc_static_runtime, is_msvc
 from conan.tools.scm import Version
@@ -73,7 +73,10 @@ class OpenblasConan(ConanFile):
         "fPIC": [True, False],
         "build_lapack": [True, False],
         "build_relapack": [True, False],
-        "use_thread": [True, False],
+        "use_thread": [True, False, "deprecated"],
+        "threading": ["serial", "pthread", "openmp"],
+        "num_threads": [None, "ANY"],
+        "num_parallel": [None, "ANY"],
         "use_locking": [True, False],
         "dynamic_arch": [True, False],
         "target": [None] + available_openblas_targets
@@ -83,7 +86,10 @@ class OpenblasConan(ConanFile):
         "fPIC": True,
         "build_lapack": True,
         "build_relapack": False,
-        "use_thread": True,
+        "use_thread": "deprecated",
+        "threading": "pthread",
+        "num_threads": None,
+        "num_parallel": None,
         "use_locking": True,
         "dynamic_arch": False,
         "target": None,
@@ -91,7 +97,10 @@ class OpenblasConan(ConanFile):
     options_description = {
         "build_lapack": "Build LAPACK and LAPACKE",
         "build_relapack": "Build with ReLAPACK (recursive implementation of several LAPACK functions on top of standard LAPACK)",
-        "use_thread": "Enable threads support",
+        "use_thread": "Deprecated, use threading instead",
+        "threading": "Threading backend: serial, pthread (OpenBLAS thread pool) or openmp",
+        "num_threads": "Maximum number of threads (NUM_THREADS), detected from the build machine if not set",
+        "num_parallel": "Maximum number of concurrent calls from different threads of the application (NUM_PARALLEL)",
         "use_locking": "Use locks even in single-threaded builds to make them callable from multiple threads",
         "dynamic_arch": "Include support for multiple CPU targets, with automatic selection at runtime (x86/x86_64, aarch64 or ppc only)",
         "target": "OpenBLAS TARGET variable (see TargetList.txt)",
@@ -118,6 +127,13 @@ class OpenblasConan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.use_thread != "deprecated":
+            self.output.warning(f"{self.name}:use_thread option is deprecated, use threading instead.")
+            self.options.threading = "pthread" if self.options.use_thread else "serial"
+        if self.options.threading == "serial":
+            self.options.rm_safe("num_threads")
+            self.options.rm_safe("num_parallel")
+
         # When cross-compiling, OpenBLAS requires explicitly setting TARGET
         if cross_building(self, skip_x64_x86=True) and not self.options.target:
             # Try inferring the target from settings.arch
@@ -126,6 +142,17 @@ class OpenblasConan(ConanFile):
                 self.output.warning(f'Setting OpenBLAS TARGET={target} based on settings.arch. This may result in suboptimal performance. Set the "{self.name}/*:target=XXX" option to silence this warning.')
                 self.options.target = target
 
+    @property
+    def _with_llvm_openmp(self):
+        return self.options.threading == "openmp" and self.settings.compiler in ["clang", "apple-clang"]
+
+    def requirements(self):
+        if self._with_llvm_openmp:
+            self.requires("llvm-openmp/17.0.6", transitive_headers=True, transitive_libs=True)
+
+    def package_id(self):
+        del self.info.options.use_thread
+
     def validate(self):
         if Version(self.version) < "0.3.24" and self.settings.arch == "armv8":
             # OpenBLAS fails to detect the appropriate target architecture for armv8 for versions < 0.3.24, as it matches the 32 bit variant instead of 64.
@@ -133,6 +160,14 @@ class OpenblasConan(ConanFile):
             # This would be a reasonably trivial hotfix to backport.
             raise ConanInvalidConfiguration("armv8 builds are not currently supported for versions lower than 0.3.24. Contributions to support this are welcome.")
 
+        if self.options.threading == "openmp" and is_msvc(self):
+            # The OpenMP 2.0 runtime of MSVC is not supported by OpenBLAS
+            raise ConanInvalidConfiguration(f'"{self.name}/*:threading=openmp" is not supported with MSVC')
+        for option in ["num_threads", "num_parallel"]:
+            value = self.options.get_safe(option)
+            if value and not (str(value).isdigit() and int(value) > 0):
+                raise ConanInvalidConfiguration(f'"{self.name}/*:{option}" must be a positive integer')
+
         if self.options.build_relapack:
             if not self.options.build_lapack:
                 raise ConanInvalidConfiguration(f'"{self.name}/*:build_relapack=True" option requires "{self.name}/*:build_lapack=True"')
@@ -177,7 +212,12 @@ class OpenblasConan(ConanFile):
         tc.variables["BUILD_RELAPACK"] = self.options.build_relapack
 
         tc.variables["DYNAMIC_ARCH"] = self.options.dynamic_arch
-        tc.variables["USE_THREAD"] = self.options.use_thread
+        tc.variables["USE_THREAD"] = self.options.threading != "serial"
+        tc.variables["USE_OPENMP"] = self.options.threading == "openmp"
+        if self.options.get_safe("num_threads"):
+            tc.cache_variables["NUM_THREADS"] = str(self.options.num_threads)
+        if self.options.get_safe("num_parallel"):
+            tc.cache_variables["NUM_PARALLEL"] = str(self.options.num_parallel)
         tc.variables["USE_LOCKING"] = self.options.use_locking
 
         tc.variables["MSVC_STATIC_CRT"] = is_msvc_static_runtime(self)
@@ -194,6 +234,10 @@ class OpenblasConan(ConanFile):
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
 
+        # find_package(OpenMP) of upstream CMakeLists must find llvm-openmp
+        deps = CMakeDeps(self)
+        deps.generate()
+
     def _patch_sources(self):
         if Version(self.version) <= "0.3.15":
             replace_in_file(self, os.path.join(self.source_folder, "cmake", "utils.cmake"),
@@ -255,22 +299,29 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
         # 'pthread' causes issues without namespace
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"  # TODO: how to model this in CMakeDeps?
+        cmake_component_name = str(self.options.threading)  # TODO: how to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("cmake_target_name", f"OpenBLAS::{cmake_component_name}")
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(os.path.join("include", "openblas"))
         self.cpp_info.components["openblas_component"].libs = [self._lib_name]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.components["openblas_component"].system_libs.append("m")
-            if self.options.use_thread:
+            if self.options.threading != "serial":
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack and self._fortran_compiler:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self.options.threading == "openmp":
+            if self._with_llvm_openmp:
+                self.cpp_info.components["openblas_component"].requires.append("llvm-openmp::llvm-openmp")
+            elif self.settings.compiler in ["gcc", "intel-cc"]:
+                # Link the OpenMP runtime of the compiler
+                openmp_flags = ["-fopenmp"] if self.settings.compiler == "gcc" else ["-qopenmp"]
+                self.cpp_info.components["openblas_component"].sharedlinkflags.extend(openmp_flags)
+                self.cpp_info.components["openblas_component"].exelinkflags.extend(openmp_flags)
 
         self.buildenv_info.define_path("OpenBLAS_HOME", self.package_folder)
         self.runenv_info.define_path("OpenBLAS_HOME", self.package_folder)
@@ -104,9 +104,10 @@ class OpenCVConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         # global options
-        "parallel": [False, "tbb", "openmp"],
+        "parallel": [False, "tbb", "openmp", "pthreads"],
         "with_ipp": [False, "intel-ipp", "opencv-icv"],
         "with_eigen": [True, False],
+        "with_lapack": [True, False],
         "neon": [True, False],
         "with_opencl": [True, False],
         "with_cuda": [True, False],
@@ -167,6 +168,7 @@ class OpenCVConan(ConanFile):
         "parallel": False,
         "with_ipp": False,
         "with_eigen": True,
+        "with_lapack": False,
         "neon": True,
         "with_opencl": False,
         "with_cuda": False,
@@ -415,6 +417,9 @@ class OpenCVConan(ConanFile):
                 return ["ippiw"]
             return []
 
+        def lapack():
+            return ["openblas::openblas_component"] if self.options.with_lapack else []
+
         def parallel():
             return ["onetbb::onetbb"] if self.options.parallel == "tbb" else []
 
@@ -503,7 +508,7 @@ class OpenCVConan(ConanFile):
             "core": {
                 "is_built": True,
                 "no_option": True,
-                "requires": ["zlib::zlib"] + parallel() + eigen() + ipp(),
+                "requires": ["zlib::zlib"] + parallel() + eigen() + ipp() + lapack(),
                 "system_libs": [
                     (self.settings.os == "Android", ["dl", "m", "log"]),
                     (self.settings.os == "FreeBSD", ["m", "pthread"]),
@@ -1109,6 +1114,8 @@ class OpenCVConan(ConanFile):
             self.requires("eigen/3.4.0")
         if self.options.parallel == "tbb":
             self.requires("onetbb/2021.10.0")
+        if self.options.with_lapack:
+            self.requires("openblas/0.3.27")
         if self.options.with_ipp == "intel-ipp":
             self.requires("intel-ipp/2020")
         # dnn module dependencies
@@ -1225,6 +1232,10 @@ class OpenCVConan(ConanFile):
         if self.options.with_ipp == "opencv-icv" and \
            not (self.settings.arch in ["x86", "x86_64"] and self.settings.os in ["Linux", "Macos", "Windows"]):
             raise ConanInvalidConfiguration(f"opencv-icv is not available for {self.settings.os}/{self.settings.arch}")
+        if self.options.parallel == "pthreads" and self.settings.os == "Windows":
+            raise ConanInvalidConfiguration("pthreads parallel framework is not available on Windows")
+        if self.options.with_lapack and not self.dependencies["openblas"].options.build_lapack:
+            raise ConanInvalidConfiguration(f"{self.ref}:with_lapack=True requires -o openblas/*:build_lapack=True")
         if self.options.viz:
             raise ConanInvalidConfiguration(
                 "viz module can't be enabled yet. It requires VTK which is not available in conan-center."
@@ -1276,6 +1287,15 @@ class OpenCVConan(ConanFile):
         if Version(self.version) >= "4.8.0":
             replace_in_file(self, os.path.join(self.source_folder, "modules", "imgcodecs", "CMakeLists.txt"), "${AVIF_LIBRARY}", "avif")
 
+        ## Use openblas from conan as LAPACK & CBLAS implementation
+        if self.options.with_lapack:
+            replace_in_file(self, os.path.join(self.source_folder, "cmake", "OpenCVFindLAPACK.cmake"),
+                            "include(cmake/OpenCVFindOpenBLAS.cmake)",
+                            "find_package(OpenBLAS REQUIRED CONFIG)\n"
+                            "set(OpenBLAS_FOUND TRUE)\n"
+                            "set(OpenBLAS_INCLUDE_DIR \"${OpenBLAS_INCLUDE_DIRS}\")\n"
+                            "set(OpenBLAS_LIB OpenBLAS::OpenBLAS)")
+
         ## Fix detection of ffmpeg
         replace_in_file(self, os.path.join(self.source_folder, "modules", "videoio", "cmake", "detect_ffmpeg.cmake"),
                         "FFMPEG_FOUND", "ffmpeg_FOUND")
@@ -1440,6 +1460,9 @@ class OpenCVConan(ConanFile):
         tc.variables["WITH_OPENGL"] = False
         tc.variables["WITH_TBB"] = self.options.parallel == "tbb"
         tc.variables["WITH_OPENMP"] = self.options.parallel == "openmp"
+        if self.options.parallel:
+            # Without an explicit backend, keep upstream default (pthreads on Unix)
+            tc.variables["WITH_PTHREADS_PF"] = self.options.parallel == "pthreads"
         tc.variables["WITH_OPENNI"] = False
         tc.variables["WITH_OPENNI2"] = False
         tc.variables["WITH_OPENVX"] = False
@@ -1457,7 +1480,9 @@ class OpenCVConan(ConanFile):
             tc.variables["VULKAN_INCLUDE_DIRS"] = os.path.join(self.dependencies["vulkan-headers"].package_folder, "include").replace("\\", "/")
         tc.variables["WITH_XIMEA"] = False
         tc.variables["WITH_XINE"] = False
-        tc.variables["WITH_LAPACK"] = False
+        tc.variables["WITH_LAPACK"] = self.options.with_lapack
+        if self.options.with_lapack:
+            tc.variables["OPENCV_LAPACK_DISABLE_MKL"] = True
 
         tc.variables["WITH_GTK"] = self.options.get_safe("with_gtk", False)
         tc.variables["WITH_GTK_2_X"] = self._is_gtk_version2
@@ -89,6 +89,7 @@ class OpenSSLConan(ConanFile):
         "no_zlib": [True, False],
         "openssldir": [None, "ANY"],
         "tls_security_level": [None, 0, 1, 2, 3, 4, 5],
+        "with_ktls": [True, False],
     }
     default_options = {key: False for key in options.keys()}
     default_options["fPIC"] = True
@@ -132,6 +133,11 @@ class OpenSSLConan(ConanFile):
     def validate(self):
         if self.settings.os == "iOS" and self.options.shared:
             raise ConanInvalidConfiguration("OpenSSL 3 does not support building shared libraries for iOS")
+        if self.options.with_ktls:
+            if self.settings.os != "Linux":
+                raise ConanInvalidConfiguration(f"{self.ref} option with_ktls=True is only supported on Linux")
+            if self.options.no_sock:
+                raise ConanInvalidConfiguration(f"{self.ref} option with_ktls=True requires no_sock=False")
 
     def build_requirements(self):
         if self.settings_build.os == "Windows":
@@ -374,6 +380,10 @@ class OpenSSLConan(ConanFile):
         if self.options.get_safe("enable_trace"):
             args.append("enable-trace")
 
+        if self.options.with_ktls:
+            # Kernel TLS offload: record encryption done by the kernel, allows SSL_sendfile()
+            args.append("enable-ktls")
+
         if self.settings.os == "Neutrino":
             args.append("no-asm -lsocket -latomic")
 
@@ -406,7 +416,7 @@ class OpenSSLConan(ConanFile):
             ])
 
         for option_name in self.default_options.keys():
-            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2"):
+            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2", "with_ktls"):
                 self.output.info(f"Activated option: {option_name}")
                 args.append(option_name.replace("_", "-"))
         return args
@@ -673,5 +683,7 @@ class OpenSSLConan(ConanFile):
         self.cpp_info.components["ssl"].set_property("cmake_target_name", "OpenSSL::SSL")
         self.cpp_info.components["ssl"].set_property("pkg_config_name", "libssl")
 
+        self.conf_info.define("user.openssl:with_ktls", bool(self.options.with_ktls))
+
         openssl_modules_dir = os.path.join(self.package_folder, "lib", "ossl-modules")
         self.runenv_info.define_path("OPENSSL_MODULES", openssl_modules_dir)
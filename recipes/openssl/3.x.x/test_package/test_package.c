@@ -1,6 +1,10 @@
 #include <stdio.h>
 #include <openssl/ssl.h>
 
+#if defined(TEST_OPENSSL_KTLS) && defined(OPENSSL_NO_KTLS)
+#error "OpenSSL was built with with_ktls=True but OPENSSL_NO_KTLS is defined"
+#endif
+
 void digest();
 int digest_legacy();
 
@@ -42,6 +42,7 @@ class OpenTelemetryCppConan(ConanFile):
         "with_logs_preview": [True, False],
         "with_async_export_preview": [True, False],
         "with_metrics_exemplar_preview": [True, False],
+        "allocator": ["system", "jemalloc", "mimalloc", "tcmalloc"],
     }
     default_options = {
         "fPIC": True,
@@ -67,6 +68,7 @@ class OpenTelemetryCppConan(ConanFile):
         "with_logs_preview": False,
         "with_async_export_preview": False,
         "with_metrics_exemplar_preview": False,
+        "allocator": "system",
     }
     short_paths = True
 
@@ -108,6 +110,11 @@ class OpenTelemetryCppConan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+        if self.options.allocator == "jemalloc":
+            self.options["jemalloc"].prefix = ""
+        elif self.options.allocator == "mimalloc":
+            self.options["mimalloc"].override = True
+
     def layout(self):
         cmake_layout(self, src_folder="src")
 
@@ -180,6 +187,21 @@ class OpenTelemetryCppConan(ConanFile):
             self.requires("thrift/0.17.0")
             self.requires("boost/1.85.0")
 
+        if self.options.allocator == "jemalloc":
+            self.requires("jemalloc/5.3.0")
+        elif self.options.allocator == "mimalloc":
+            self.requires("mimalloc/2.1.9")
+        elif self.options.allocator == "tcmalloc":
+            self.requires("gperftools/2.16")
+
+    @property
+    def _allocator_requirement(self):
+        return {
+            "jemalloc": "jemalloc::jemalloc",
+            "mimalloc": "mimalloc::mimalloc",
+            "tcmalloc": "gperftools::gperftools",
+        }.get(str(self.options.allocator))
+
     @property
     def _required_boost_components(self):
         return ["locale"] if self.options.get_safe("with_jaeger") else []
@@ -214,6 +236,11 @@ class OpenTelemetryCppConan(ConanFile):
             # https://github.com/conan-io/conan-center-index/pull/21332#issuecomment-1830766894
             raise ConanInvalidConfiguration("opentelemetry-cpp >= 1.12.0 does not support Apple Clang on Conan v1")
 
+        if self.options.allocator == "jemalloc" and self.dependencies["jemalloc"].options.prefix:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=jemalloc requires jemalloc/*:prefix to be empty")
+        if self.options.allocator == "mimalloc" and not self.dependencies["mimalloc"].options.override:
+            raise ConanInvalidConfiguration(f"{self.ref} option allocator=mimalloc requires mimalloc/*:override=True")
+
     def build_requirements(self):
         if self._needs_proto:
             if Version(self.version) >= "1.18.0":
@@ -437,6 +464,9 @@ class OpenTelemetryCppConan(ConanFile):
         if self.settings.os in ("Linux", "FreeBSD"):
             self.cpp_info.components["opentelemetry_common"].system_libs.extend(["pthread"])
 
+        if self._allocator_requirement:
+            self.cpp_info.components["opentelemetry_common"].requires.append(self._allocator_requirement)
+
         if Version(self.version) >= "1.16.0" and is_apple_os(self):
             self.cpp_info.components["opentelemetry_common"].frameworks.extend(["CoreFoundation"])
 
@@ -58,6 +58,7 @@ class ProtobufConan(ConanFile):
     def export_sources(self):
         export_conandata_patches(self)
         copy(self, "protobuf-conan-protoc-target.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
+        copy(self, "protobuf-conan-generate.cmake", self.recipe_folder, os.path.join(self.export_sources_folder, "src"))
 
     def config_options(self):
         if self.settings.os == "Windows":
@@ -222,6 +223,7 @@ class ProtobufConan(ConanFile):
         rm(self, "protobuf-config*.cmake", folder=cmake_config_folder)
         rm(self, "protobuf-targets*.cmake", folder=cmake_config_folder)
         copy(self, "protobuf-conan-protoc-target.cmake", src=self.source_folder, dst=cmake_config_folder)
+        copy(self, "protobuf-conan-generate.cmake", src=self.source_folder, dst=cmake_config_folder)
 
         if not self.options.lite:
             rm(self, "libprotobuf-lite*", os.path.join(self.package_folder, "lib"))
@@ -238,6 +240,7 @@ class ProtobufConan(ConanFile):
             os.path.join(self._cmake_install_base_path, "protobuf-module.cmake"),
             os.path.join(self._cmake_install_base_path, "protobuf-options.cmake"),
             os.path.join(self._cmake_install_base_path, "protobuf-conan-protoc-target.cmake"),
+            os.path.join(self._cmake_install_base_path, "protobuf-conan-generate.cmake"),
         ]
         self.cpp_info.set_property("cmake_build_modules", build_modules)
 
@@ -289,6 +292,9 @@ class ProtobufConan(ConanFile):
         if self.settings.os == "Windows":
             if self.options.shared:
                 self.cpp_info.components["libprotobuf"].defines = ["PROTOBUF_USE_DLLS"]
+        if not self.options.with_rtti:
+            # Consumers must see the same configuration as the library (protobuf_DISABLE_RTTI)
+            self.cpp_info.components["libprotobuf"].defines.append("GOOGLE_PROTOBUF_NO_RTTI=1")
 
         # libprotoc
         if self.settings.os != "tvOS":
@@ -311,6 +317,8 @@ class ProtobufConan(ConanFile):
             if self.settings.os == "Windows":
                 if self.options.shared:
                     self.cpp_info.components["libprotobuf-lite"].defines = ["PROTOBUF_USE_DLLS"]
+            if not self.options.with_rtti:
+                self.cpp_info.components["libprotobuf-lite"].defines.append("GOOGLE_PROTOBUF_NO_RTTI=1")
             if self.settings.os == "Android":
                 self.cpp_info.components["libprotobuf-lite"].system_libs.append("log")
             if self._protobuf_release >= "22.0":
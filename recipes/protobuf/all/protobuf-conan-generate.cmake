@@ -0,0 +1,61 @@
+# protobuf_conan_generate(TARGET <target>
+#                         [LITE]
+#                         [PROTOS <proto files>...]
+#                         [IMPORT_DIRS <dirs>...]
+#                         [PROTOC_OUT_DIR <dir>]
+#                         [EXPORT_MACRO <macro>]
+#                         [PLUGIN_OPTIONS <options>...])
+#
+# Thin wrapper around protobuf_generate() for C++ code, which also links the matching runtime:
+# - LITE generates code for the lite runtime (same as "option optimize_for = LITE_RUNTIME;"
+#   in every .proto file) and links protobuf::libprotobuf-lite instead of protobuf::libprotobuf.
+# - PLUGIN_OPTIONS are extra options of the C++ generator, joined with commas.
+#   protobuf_generate() of protobuf < 3.22 has no PLUGIN_OPTIONS argument, so PLUGIN_OPTIONS
+#   and LITE are rejected with those versions.
+# Generated messages always support arena allocation (cc_enable_arenas is true by default since 3.14).
+function(protobuf_conan_generate)
+    cmake_parse_arguments(_pcg "LITE" "TARGET;PROTOC_OUT_DIR;EXPORT_MACRO" "PROTOS;IMPORT_DIRS;PLUGIN_OPTIONS" ${ARGN})
+    if(NOT _pcg_TARGET)
+        message(FATAL_ERROR "protobuf_conan_generate: TARGET is required")
+    endif()
+
+    set(_pcg_plugin_options ${_pcg_PLUGIN_OPTIONS})
+    if((_pcg_PLUGIN_OPTIONS OR _pcg_LITE) AND protobuf_VERSION VERSION_LESS "3.22")
+        message(FATAL_ERROR "protobuf_conan_generate: PLUGIN_OPTIONS and LITE require protobuf >= 3.22, "
+                            "whose protobuf_generate() accepts generator options (found ${protobuf_VERSION})")
+    endif()
+    if(_pcg_LITE)
+        if(NOT TARGET protobuf::libprotobuf-lite)
+            message(FATAL_ERROR "protobuf_conan_generate: LITE requires protobuf built with lite=True")
+        endif()
+        list(APPEND _pcg_plugin_options lite)
+        set(_pcg_runtime protobuf::libprotobuf-lite)
+    else()
+        set(_pcg_runtime protobuf::libprotobuf)
+    endif()
+
+    if(NOT _pcg_PROTOC_OUT_DIR)
+        set(_pcg_PROTOC_OUT_DIR ${CMAKE_CURRENT_BINARY_DIR})
+    endif()
+    # protoc does not create the output directory
+    file(MAKE_DIRECTORY ${_pcg_PROTOC_OUT_DIR})
+
+    set(_pcg_args TARGET ${_pcg_TARGET} LANGUAGE cpp PROTOC_OUT_DIR ${_pcg_PROTOC_OUT_DIR})
+    if(_pcg_plugin_options)
+        list(JOIN _pcg_plugin_options "," _pcg_plugin_options)
+        list(APPEND _pcg_args PLUGIN_OPTIONS ${_pcg_plugin_options})
+    endif()
+    if(_pcg_EXPORT_MACRO)
+        list(APPEND _pcg_args EXPORT_MACRO ${_pcg_EXPORT_MACRO})
+    endif()
+    if(_pcg_PROTOS)
+        list(APPEND _pcg_args PROTOS ${_pcg_PROTOS})
+    endif()
+    if(_pcg_IMPORT_DIRS)
+        list(APPEND _pcg_args IMPORT_DIRS ${_pcg_IMPORT_DIRS})
+    endif()
+    protobuf_generate(${_pcg_args})
+
+    target_include_directories(${_pcg_TARGET} PUBLIC $<BUILD_INTERFACE:${_pcg_PROTOC_OUT_DIR}>)
+    target_link_libraries(${_pcg_TARGET} PUBLIC ${_pcg_runtime})
+endfunction()
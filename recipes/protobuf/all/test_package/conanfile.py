@@ -33,6 +33,10 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            self.run(os.path.join(self.cpp.build.bindirs[0], "test_generate"), env="conanrun")
+            protobuf = self.dependencies[self.tested_reference_str]
+            if protobuf.options.lite and protobuf.ref.version >= "3.22":
+                self.run(os.path.join(self.cpp.build.bindirs[0], "test_generate_lite"), env="conanrun")
 
             # Invoke protoc in the same way CMake would
             self.run(f"protoc --proto_path={self.source_folder} --cpp_out={self.build_folder} {self.source_folder}/addressbook.proto", env="conanrun")
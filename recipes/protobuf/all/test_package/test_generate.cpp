@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include <iostream>
+#include <string>
+
+#include "greeting.pb.h"
+
+int main()
+{
+	conan_test::Greeting greeting;
+	greeting.set_text("hello");
+	greeting.set_count(3);
+
+	std::string buffer;
+	conan_test::Greeting parsed;
+	if (!greeting.SerializeToString(&buffer) || !parsed.ParseFromString(buffer)) {
+		return EXIT_FAILURE;
+	}
+	if (parsed.text() != "hello" || parsed.count() != 3) {
+		return EXIT_FAILURE;
+	}
+	std::cout << parsed.text() << " x" << parsed.count() << "\n";
+	return EXIT_SUCCESS;
+}
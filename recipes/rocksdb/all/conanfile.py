@@ -33,8 +33,10 @@ class RocksDBConan(ConanFile):
         "with_zstd": [True, False],
         "with_tbb": [True, False],
         "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
         "use_rtti": [True, False],
+        "use_coroutines": [True, False],
     }
     default_options = {
         "shared": False,
@@ -47,8 +49,10 @@ class RocksDBConan(ConanFile):
         "with_gflags": False,
         "with_tbb": False,
         "with_jemalloc": False,
+        "with_liburing": False,
         "enable_sse": False,
         "use_rtti": False,
+        "use_coroutines": False,
     }
 
     @property
@@ -63,6 +67,9 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+            del self.options.use_coroutines
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -88,10 +95,24 @@ class RocksDBConan(ConanFile):
             self.requires("onetbb/2021.10.0")
         if self.options.with_jemalloc:
             self.requires("jemalloc/5.3.0")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.6")
+        if self.options.get_safe("use_coroutines"):
+            self.requires("folly/2024.08.12.00")
 
     def validate(self):
         check_min_cppstd(self, self._min_cppstd)
 
+        if self.options.get_safe("use_coroutines"):
+            # folly::coro based MultiGet is built with -fcoroutines and C++20
+            if Version(self.version) < "8.8.1":
+                raise ConanInvalidConfiguration(f"{self.ref} option use_coroutines=True requires rocksdb >= 8.8.1")
+            check_min_cppstd(self, "20")
+            if self.settings.compiler != "gcc":
+                raise ConanInvalidConfiguration(f"{self.ref} option use_coroutines=True is only supported with gcc")
+            if self.options.shared:
+                raise ConanInvalidConfiguration(f"{self.ref} option use_coroutines=True cannot be used with shared=True")
+
         if self.settings.arch not in ["x86_64", "ppc64le", "ppc64", "mips64", "armv8"]:
             raise ConanInvalidConfiguration("Rocksdb requires 64 bits")
 
@@ -120,6 +141,8 @@ class RocksDBConan(ConanFile):
         tc.variables["WITH_ZSTD"] = self.options.with_zstd
         tc.variables["WITH_TBB"] = self.options.get_safe("with_tbb", False)
         tc.variables["WITH_JEMALLOC"] = self.options.with_jemalloc
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
+        tc.variables["USE_COROUTINES"] = self.options.get_safe("use_coroutines", False)
         tc.variables["ROCKSDB_BUILD_SHARED"] = self.options.shared
         tc.variables["ROCKSDB_LIBRARY_EXPORTS"] = self.settings.os == "Windows" and self.options.shared
         tc.variables["ROCKSDB_DLL" ] = self.settings.os == "Windows" and self.options.shared
@@ -143,6 +166,12 @@ class RocksDBConan(ConanFile):
             deps.set_property("jemalloc", "cmake_target_name", "JeMalloc::JeMalloc")
         if self.options.with_zstd:
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.get_safe("use_coroutines"):
+            # FOLLY_LIBRARIES is checked to avoid the getdeps.py fallback
+            deps.set_property("folly", "cmake_additional_variables_prefixes", ["FOLLY"])
         deps.generate()
 
     def build(self):
@@ -206,3 +235,7 @@ class RocksDBConan(ConanFile):
             self.cpp_info.components["librocksdb"].requires.append("onetbb::onetbb")
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.get_safe("use_coroutines"):
+            self.cpp_info.components["librocksdb"].requires.append("folly::libfolly")
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import copy, get, rmdir
@@ -23,11 +24,34 @@ class SimdjsonConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "threads": [True, False],
+        "implementation": ["auto", "fallback", "westmere", "haswell", "icelake", "arm64", "ppc64"],
+        "exceptions": [True, False],
+        "development_checks": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threads": True,
+        "implementation": "auto",
+        "exceptions": True,
+        "development_checks": True,
+    }
+    options_description = {
+        "implementation": "Build a single kernel instead of all kernels selected at runtime (auto)",
+        "exceptions": "Enable the exception-based API (SIMDJSON_EXCEPTIONS)",
+        "development_checks": "Keep the development checks of non-NDEBUG builds (SIMDJSON_DEVELOPMENT_CHECKS)",
+    }
+
+    # Kernels available for each architecture, and the ISA extensions they are built with
+    _implementations = {
+        "x86_64": {
+            "westmere": ["sse4.2", "pclmul", "popcnt"],
+            "haswell": ["avx2", "bmi", "pclmul", "lzcnt", "popcnt"],
+            "icelake": ["avx512f", "avx512dq", "avx512cd", "avx512bw", "avx512vbmi", "avx512vbmi2", "avx512vl",
+                        "avx2", "bmi", "pclmul", "lzcnt", "popcnt"],
+        },
+        "armv8": {"arm64": []},
+        "ppc64le": {"ppc64": []},
     }
 
     def config_options(self):
@@ -45,6 +69,35 @@ class SimdjsonConan(ConanFile):
 
     def validate(self):
         check_min_cppstd(self, 17)
+        implementation = str(self.options.implementation)
+        if implementation not in ["auto", "fallback"] and \
+           implementation not in self._implementations.get(str(self.settings.arch), {}):
+            raise ConanInvalidConfiguration(f"{self.ref}:implementation={implementation} is not available for {self.settings.arch}")
+
+    @property
+    def _implementation_defines(self):
+        implementation = str(self.options.implementation)
+        if implementation == "auto":
+            return []
+        # Disable every other kernel so that the dispatch layer and unused kernels are compiled out
+        all_implementations = ["fallback"] + [name for kernels in self._implementations.values() for name in kernels]
+        defines = [f"SIMDJSON_IMPLEMENTATION_{name.upper()}={int(name == implementation)}" for name in all_implementations]
+        defines.append(f"SIMDJSON_BUILTIN_IMPLEMENTATION={implementation}")
+        return defines
+
+    @property
+    def _implementation_flags(self):
+        features = self._implementations.get(str(self.settings.arch), {}).get(str(self.options.implementation), [])
+        if not features:
+            return []
+        if is_msvc(self):
+            # MSVC exposes the intrinsics without switches, /arch only matters for AVX code generation
+            if "avx512f" in features:
+                return ["/arch:AVX512"]
+            if "avx2" in features:
+                return ["/arch:AVX2"]
+            return []
+        return [f"-m{feature}" for feature in features]
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -62,6 +115,15 @@ class SimdjsonConan(ConanFile):
         tc = CMakeToolchain(self)
         tc.variables["SIMDJSON_ENABLE_THREADS"] = self.options.threads
         tc.variables["SIMDJSON_DEVELOPER_MODE"] = False
+        tc.variables["SIMDJSON_EXCEPTIONS"] = self.options.exceptions
+        if self.options.implementation != "auto":
+            tc.cache_variables["SIMDJSON_IMPLEMENTATION"] = str(self.options.implementation)
+        for define in self._implementation_defines:
+            name, value = define.split("=", 1)
+            tc.preprocessor_definitions[name] = value
+        if not self.options.development_checks:
+            tc.preprocessor_definitions["SIMDJSON_DEVELOPMENT_CHECKS"] = "0"
+        tc.extra_cxxflags = self._implementation_flags
         cppstd = self._cmake_cxx_standard
         if cppstd:
             tc.variables["SIMDJSON_CXX_STANDARD"] = cppstd
@@ -87,8 +149,14 @@ class SimdjsonConan(ConanFile):
         self.cpp_info.libs = ["simdjson"]
         if self.settings.os in ["Linux", "FreeBSD"]:
             self.cpp_info.system_libs = ["m"]
+        self.cpp_info.defines = self._implementation_defines
+        self.cpp_info.cxxflags = self._implementation_flags
+        if not self.options.exceptions:
+            self.cpp_info.defines.append("SIMDJSON_EXCEPTIONS=0")
+        if not self.options.development_checks:
+            self.cpp_info.defines.append("SIMDJSON_DEVELOPMENT_CHECKS=0")
         if self.options.threads:
-            self.cpp_info.defines = ["SIMDJSON_THREADS_ENABLED=1"]
+            self.cpp_info.defines.append("SIMDJSON_THREADS_ENABLED=1")
             if self.settings.os in ["Linux", "FreeBSD"]:
                 self.cpp_info.system_libs.append("pthread")
         if self.options.shared:
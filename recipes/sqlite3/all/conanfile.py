@@ -48,6 +48,14 @@ class Sqlite3Conan(ConanFile):
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
+        "enable_stat4": [True, False],
+        "default_memstatus": [True, False],
+        "like_doesnt_match_blobs": [True, False],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "default_cache_size": [None, "ANY"],
+        "default_page_size": [None, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536],
+        "default_wal_synchronous": [None, "off", "normal", "full", "extra"],
     }
     default_options = {
         "shared": False,
@@ -80,6 +88,14 @@ class Sqlite3Conan(ConanFile):
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
+        "enable_stat4": False,
+        "default_memstatus": True,
+        "like_doesnt_match_blobs": False,
+        "default_mmap_size": None,      # Uses default value from source
+        "max_mmap_size": None,          # Uses default value from source
+        "default_cache_size": None,     # Uses default value from source
+        "default_page_size": None,      # Uses default value from source
+        "default_wal_synchronous": None,  # Same as the synchronous setting
     }
 
     exports_sources = "CMakeLists.txt"
@@ -108,6 +124,13 @@ class Sqlite3Conan(ConanFile):
                 raise ConanInvalidConfiguration("build_executable=True cannot be combined with enable_default_vfs=False")
             if self.options.omit_load_extension:
                 raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
+        for option in ["max_column", "max_variable_number", "max_blob_size", "default_mmap_size", "max_mmap_size", "default_cache_size"]:
+            value = self.options.get_safe(option)
+            if value and not str(value).lstrip("-").isdigit():
+                raise ConanInvalidConfiguration(f"{self.ref}:{option} must be an integer, got '{value}'")
+        if self.options.default_mmap_size.value is not None and self.options.max_mmap_size.value is not None and \
+           int(self.options.default_mmap_size) > int(self.options.max_mmap_size):
+            raise ConanInvalidConfiguration(f"{self.ref}:default_mmap_size cannot be greater than max_mmap_size")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -153,6 +176,20 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
+        tc.variables["ENABLE_STAT4"] = self.options.enable_stat4
+        tc.variables["DISABLE_MEMSTATUS"] = not self.options.default_memstatus
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
+        if self.options.default_mmap_size.value is not None:
+            tc.variables["DEFAULT_MMAP_SIZE"] = self.options.default_mmap_size
+        if self.options.max_mmap_size.value is not None:
+            tc.variables["MAX_MMAP_SIZE"] = self.options.max_mmap_size
+        if self.options.default_cache_size.value is not None:
+            tc.variables["DEFAULT_CACHE_SIZE"] = self.options.default_cache_size
+        if self.options.default_page_size:
+            tc.variables["DEFAULT_PAGE_SIZE"] = self.options.default_page_size
+        if self.options.default_wal_synchronous:
+            wal_synchronous = {"off": 0, "normal": 1, "full": 2, "extra": 3}
+            tc.variables["DEFAULT_WAL_SYNCHRONOUS"] = wal_synchronous[str(self.options.default_wal_synchronous)]
         tc.generate()
 
     def build(self):
@@ -1,4 +1,5 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, rename, replace_in_file, rm, rmdir, save
@@ -28,11 +29,27 @@ class XZUtilsConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "threads": ["auto", "posix", "win95", "vista", "no"],
+        "small": [True, False],
+        "match_finders": [None, "ANY"],
+        "filters": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "threads": "auto",
+        "small": False,
+        "match_finders": None,
+        "filters": None,
     }
+    options_description = {
+        "threads": "Threading model of liblzma (--enable-threads), multithreaded coders are not available with no",
+        "small": "Build the smaller but slower variant of liblzma (--enable-small)",
+        "match_finders": "Comma-separated list of match finders to build (hc3, hc4, bt2, bt3, bt4), all if not set",
+        "filters": "Comma-separated list of filters to build encoders and decoders for, all if not set",
+    }
+
+    _match_finders = ["hc3", "hc4", "bt2", "bt3", "bt4"]
 
     @property
     def _settings_build(self):
@@ -58,6 +75,17 @@ class XZUtilsConan(ConanFile):
                            and self.settings.get_safe("compiler.runtime") is not None)
         return is_msvc(self) or assume_clang_cl
 
+    @property
+    def _available_filters(self):
+        filters = ["lzma1", "lzma2", "delta", "x86", "powerpc", "ia64", "arm", "armthumb", "sparc"]
+        if Version(self.version) >= "5.4.0":
+            filters.append("arm64")
+        return filters
+
+    @staticmethod
+    def _split_list(value):
+        return [item.strip() for item in str(value).split(",") if item.strip()] if value else []
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -74,6 +102,20 @@ class XZUtilsConan(ConanFile):
     def layout(self):
         basic_layout(self, src_folder="src")
 
+    def validate(self):
+        if self.options.threads in ["win95", "vista"] and self.settings.os != "Windows":
+            raise ConanInvalidConfiguration(f"{self.ref}:threads={self.options.threads} is only available on Windows")
+        if self._use_msbuild:
+            # upstream Visual Studio solution comes with a fixed config.h
+            for option in ["threads", "small", "match_finders", "filters"]:
+                if self.options.get_safe(option) != self.default_options[option]:
+                    raise ConanInvalidConfiguration(f"{self.ref}:{option} can't be changed when building with MSBuild")
+        for option, available in [("match_finders", self._match_finders), ("filters", self._available_filters)]:
+            values = self._split_list(self.options.get_safe(option))
+            unknown = sorted(set(values) - set(available))
+            if unknown:
+                raise ConanInvalidConfiguration(f"{self.ref}:{option} has unknown values: {', '.join(unknown)}. Available: {', '.join(available)}")
+
     def build_requirements(self):
         if self._settings_build.os == "Windows" and not self._use_msbuild:
             self.win_bash = True
@@ -95,6 +137,15 @@ class XZUtilsConan(ConanFile):
             tc.configure_args.append("--disable-doc")
             if self.settings.build_type == "Debug":
                 tc.configure_args.append("--enable-debug")
+            threads = "yes" if self.options.threads == "auto" else str(self.options.threads)
+            tc.configure_args.append(f"--enable-threads={threads}")
+            tc.configure_args.append("--enable-small" if self.options.small else "--disable-small")
+            if self.options.match_finders:
+                tc.configure_args.append(f"--enable-match-finders={','.join(self._split_list(self.options.match_finders))}")
+            if self.options.filters:
+                filters = ",".join(self._split_list(self.options.filters))
+                tc.configure_args.append(f"--enable-encoders={filters}")
+                tc.configure_args.append(f"--enable-decoders={filters}")
             tc.generate()
 
     @property
@@ -207,7 +258,7 @@ class XZUtilsConan(ConanFile):
         self.cpp_info.libs = ["lzma"]
         if not self.options.shared:
             self.cpp_info.defines.append("LZMA_API_STATIC")
-        if self.settings.os in ["Linux", "FreeBSD"]:
+        if self.settings.os in ["Linux", "FreeBSD"] and self.options.threads != "no":
             self.cpp_info.system_libs.append("pthread")
 
         # TODO: to remove in conan v2 once cmake_find_package* & pkg_config generators removed
@@ -60,6 +60,8 @@ class ZlibNgConan(ConanFile):
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
         if self.options.zlib_compat:
+            # allows zlib-ng to be swapped in for zlib with
+            # [replace_requires] zlib/*: zlib-ng/<version> in a profile
             self.provides = ["zlib"]
 
     def layout(self):
@@ -0,0 +1,42 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.build import can_run
+from conan.tools.cmake import CMake, cmake_layout
+import os
+
+
+# Manual-only test, not run by "conan create" nor CI: test_package cannot do it
+# because libpng requires zlib, which only a profile can replace by zlib-ng.
+# Builds libpng against zlib-ng in zlib compat mode. Run it on an already
+# created zlib-ng with a profile replacing zlib, e.g.:
+#   [replace_requires]
+#   zlib/*: zlib-ng/<version>
+#   [options]
+#   zlib-ng/*:zlib_compat=True
+# and:
+#   conan test test_libpng zlib-ng/<version> -pr:h <that profile> --build=missing
+class TestLibpngConan(ConanFile):
+    settings = "os", "arch", "compiler", "build_type"
+    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    test_type = "explicit"
+
+    def layout(self):
+        cmake_layout(self)
+
+    def requirements(self):
+        self.requires(self.tested_reference_str)
+        self.requires("libpng/1.6.48")
+
+    def validate(self):
+        if not self.dependencies["zlib-ng"].options.zlib_compat:
+            raise ConanInvalidConfiguration("test_libpng requires zlib-ng/*:zlib_compat=True")
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def test(self):
+        if can_run(self):
+            bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
+            self.run(bin_path, env="conanrun")
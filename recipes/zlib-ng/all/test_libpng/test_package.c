@@ -0,0 +1,68 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include "png.h"
+#include "zlib.h"
+
+#define WIDTH 64
+#define HEIGHT 64
+
+int main(void) {
+    png_image image;
+    png_byte pixels[WIDTH * HEIGHT];
+    png_byte decoded[WIDTH * HEIGHT];
+    png_alloc_size_t size = 0;
+    void *buffer;
+    int x, y;
+
+    printf("libpng %s with zlib %s\n", png_libpng_ver, zlibVersion());
+    if (strstr(zlibVersion(), "zlib-ng") == NULL) {
+        fprintf(stderr, "libpng is not linked against zlib-ng\n");
+        return EXIT_FAILURE;
+    }
+
+    for (y = 0; y < HEIGHT; ++y) {
+        for (x = 0; x < WIDTH; ++x) {
+            pixels[y * WIDTH + x] = (png_byte)(x ^ y);
+        }
+    }
+
+    /* round-trip an image through deflate and inflate */
+    memset(&image, 0, sizeof(image));
+    image.version = PNG_IMAGE_VERSION;
+    image.width = WIDTH;
+    image.height = HEIGHT;
+    image.format = PNG_FORMAT_GRAY;
+    if (!png_image_write_get_memory_size(image, size, 0, pixels, 0, NULL)) {
+        fprintf(stderr, "png write failed: %s\n", image.message);
+        return EXIT_FAILURE;
+    }
+    buffer = malloc(size);
+    if (buffer == NULL || !png_image_write_to_memory(&image, buffer, &size, 0, pixels, 0, NULL)) {
+        fprintf(stderr, "png write failed: %s\n", image.message);
+        free(buffer);
+        return EXIT_FAILURE;
+    }
+
+    memset(&image, 0, sizeof(image));
+    image.version = PNG_IMAGE_VERSION;
+    if (!png_image_begin_read_from_memory(&image, buffer, size)) {
+        fprintf(stderr, "png read failed: %s\n", image.message);
+        free(buffer);
+        return EXIT_FAILURE;
+    }
+    image.format = PNG_FORMAT_GRAY;
+    if (!png_image_finish_read(&image, NULL, decoded, 0, NULL)) {
+        fprintf(stderr, "png read failed: %s\n", image.message);
+        free(buffer);
+        return EXIT_FAILURE;
+    }
+    free(buffer);
+
+    if (memcmp(pixels, decoded, sizeof(pixels)) != 0) {
+        fprintf(stderr, "decoded image does not match\n");
+        return EXIT_FAILURE;
+    }
+    return EXIT_SUCCESS;
+}
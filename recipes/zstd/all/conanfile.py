@@ -1,6 +1,7 @@
 from conan import ConanFile
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 from conan.tools.files import apply_conandata_patches, collect_libs, copy, export_conandata_patches, get, replace_in_file, rmdir, rm
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import glob
 import os
@@ -22,12 +23,23 @@ class ZstdConan(ConanFile):
         "fPIC": [True, False],
         "threading": [True, False],
         "build_programs": [True, False],
+        "legacy_support": [True, False],
+        "with_asm": [True, False],
+        "dynamic_bmi2": ["auto", True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "threading": True,
         "build_programs": True,
+        "legacy_support": True,
+        "with_asm": True,
+        "dynamic_bmi2": "auto",
+    }
+    options_description = {
+        "legacy_support": "Decode frames of pre-v0.8 formats (ZSTD_LEGACY_SUPPORT)",
+        "with_asm": "Use the x86-64 assembly Huffman decoder, disabled with ZSTD_DISABLE_ASM otherwise",
+        "dynamic_bmi2": "Compile BMI2 code paths selected at runtime (DYNAMIC_BMI2), auto lets zstd decide",
     }
 
     def export_sources(self):
@@ -36,6 +48,12 @@ class ZstdConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch != "x86_64":
+            del self.options.with_asm
+            del self.options.dynamic_bmi2
+        elif is_msvc(self):
+            # zstd doesn't build its assembly with MSVC
+            del self.options.with_asm
 
     def configure(self):
         if self.options.shared:
@@ -55,6 +73,12 @@ class ZstdConan(ConanFile):
         tc.variables["ZSTD_BUILD_STATIC"] = not self.options.shared or self.options.build_programs
         tc.variables["ZSTD_BUILD_SHARED"] = self.options.shared
         tc.variables["ZSTD_MULTITHREAD_SUPPORT"] = self.options.threading
+        tc.variables["ZSTD_LEGACY_SUPPORT"] = self.options.legacy_support
+        if not self.options.get_safe("with_asm", True):
+            tc.preprocessor_definitions["ZSTD_DISABLE_ASM"] = "1"
+        dynamic_bmi2 = self.options.get_safe("dynamic_bmi2", "auto")
+        if dynamic_bmi2 != "auto":
+            tc.preprocessor_definitions["DYNAMIC_BMI2"] = "1" if dynamic_bmi2 else "0"
         if Version(self.version) < "1.5.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()